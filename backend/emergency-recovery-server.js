@@ -116,10 +116,9 @@ app.post('/api/emergency/login', (req, res) => {
     }
 });
 
-// Check database status
-app.get('/api/emergency/database-status', emergencyAuth, async (req, res) => {
+// Try to connect to the database; never throws
+async function getDatabaseStatus() {
     try {
-        // Try to connect to database
         const { Pool } = require('pg');
         const pool = new Pool({
             user: process.env.DB_USER || 'postgres',
@@ -133,24 +132,85 @@ app.get('/api/emergency/database-status', emergencyAuth, async (req, res) => {
         const result = await pool.query('SELECT 1');
         await pool.end();
         
-        res.json({
-            success: true,
-            data: {
-                status: 'online',
-                message: 'Database is accessible'
-            }
-        });
+        return {
+            status: 'online',
+            message: 'Database is accessible'
+        };
     } catch (error) {
         logRecovery(`Database status check failed: ${error.message}`);
-        res.json({
-            success: true,
-            data: {
-                status: 'offline',
-                message: 'Database is not accessible',
-                error: error.message
-            }
-        });
+        return {
+            status: 'offline',
+            message: 'Database is not accessible',
+            error: error.message
+        };
     }
+}
+
+// Backup files, newest first; null when the backups directory is missing
+function listBackups() {
+    if (!fs.existsSync(BACKUPS_DIR)) {
+        return null;
+    }
+    
+    return fs.readdirSync(BACKUPS_DIR)
+        .filter(file => file.endsWith('.sql') || file.endsWith('.backup'))
+        .map(file => {
+            const filePath = path.join(BACKUPS_DIR, file);
+            const stats = fs.statSync(filePath);
+            
+            return {
+                filename: file,
+                size: stats.size,
+                sizeFormatted: `${(stats.size / (1024 * 1024)).toFixed(2)} MB`,
+                created: stats.birthtime,
+                modified: stats.mtime,
+                type: file.includes('schema') ? 'schema' : 
+                      file.includes('data') ? 'data' : 'complete'
+            };
+        })
+        .sort((a, b) => new Date(b.modified) - new Date(a.modified));
+}
+
+// Server, backup directory and log file summary
+function getServerStatus() {
+    const uptime = process.uptime();
+    const uptimeFormatted = `${Math.floor(uptime / 60)}m ${Math.floor(uptime % 60)}s`;
+    
+    // Get backup count
+    let backupCount = 0;
+    if (fs.existsSync(BACKUPS_DIR)) {
+        backupCount = fs.readdirSync(BACKUPS_DIR)
+            .filter(file => file.endsWith('.sql') || file.endsWith('.backup'))
+            .length;
+    }
+    
+    return {
+        server: {
+            status: 'online',
+            uptime: uptimeFormatted,
+            uptimeSeconds: Math.floor(uptime),
+            port: PORT,
+            mode: 'emergency_recovery'
+        },
+        backups: {
+            count: backupCount,
+            directory: BACKUPS_DIR,
+            available: backupCount > 0
+        },
+        logs: {
+            file: RECOVERY_LOG,
+            exists: fs.existsSync(RECOVERY_LOG)
+        },
+        timestamp: new Date().toISOString()
+    };
+}
+
+// Check database status
+app.get('/api/emergency/database-status', emergencyAuth, async (req, res) => {
+    res.json({
+        success: true,
+        data: await getDatabaseStatus()
+    });
 });
 
 // List backup files
@@ -158,31 +218,14 @@ app.get('/api/emergency/backups', emergencyAuth, (req, res) => {
     try {
         logRecovery('Listing backup files for emergency recovery');
         
-        if (!fs.existsSync(BACKUPS_DIR)) {
+        const files = listBackups();
+        if (!files) {
             return res.status(404).json({
                 success: false,
                 message: 'Backups directory not found'
             });
         }
         
-        const files = fs.readdirSync(BACKUPS_DIR)
-            .filter(file => file.endsWith('.sql') || file.endsWith('.backup'))
-            .map(file => {
-                const filePath = path.join(BACKUPS_DIR, file);
-                const stats = fs.statSync(filePath);
-                
-                return {
-                    filename: file,
-                    size: stats.size,
-                    sizeFormatted: `${(stats.size / (1024 * 1024)).toFixed(2)} MB`,
-                    created: stats.birthtime,
-                    modified: stats.mtime,
-                    type: file.includes('schema') ? 'schema' : 
-                          file.includes('data') ? 'data' : 'complete'
-                };
-            })
-            .sort((a, b) => new Date(b.modified) - new Date(a.modified));
-        
         res.json({
             success: true,
             data: {
@@ -418,43 +461,41 @@ app.get('/api/emergency/logs', emergencyAuth, (req, res) => {
 // Emergency status endpoint
 app.get('/api/emergency/status', emergencyAuth, (req, res) => {
     try {
-        const uptime = process.uptime();
-        const uptimeFormatted = `${Math.floor(uptime / 60)}m ${Math.floor(uptime % 60)}s`;
-        
-        // Get backup count
-        let backupCount = 0;
-        if (fs.existsSync(BACKUPS_DIR)) {
-            backupCount = fs.readdirSync(BACKUPS_DIR)
-                .filter(file => file.endsWith('.sql') || file.endsWith('.backup'))
-                .length;
-        }
+        res.json({
+            success: true,
+            data: getServerStatus()
+        });
+    } catch (error) {
+        res.status(500).json({
+            success: false,
+            message: 'Failed to get emergency status',
+            error: error.message
+        });
+    }
+});
+
+// Database status, backup listing and server status in one response
+app.get('/api/emergency/integration-snapshot', emergencyAuth, async (req, res) => {
+    try {
+        const files = listBackups() || [];
         
         res.json({
             success: true,
             data: {
-                server: {
-                    status: 'online',
-                    uptime: uptimeFormatted,
-                    uptimeSeconds: Math.floor(uptime),
-                    port: PORT,
-                    mode: 'emergency_recovery'
-                },
+                database: await getDatabaseStatus(),
                 backups: {
-                    count: backupCount,
-                    directory: BACKUPS_DIR,
-                    available: backupCount > 0
-                },
-                logs: {
-                    file: RECOVERY_LOG,
-                    exists: fs.existsSync(RECOVERY_LOG)
+                    backups: files,
+                    total: files.length,
+                    directory: BACKUPS_DIR
                 },
-                timestamp: new Date().toISOString()
+                status: getServerStatus()
             }
         });
     } catch (error) {
+        logRecovery(`Error building integration snapshot: ${error.message}`);
         res.status(500).json({
             success: false,
-            message: 'Failed to get emergency status',
+            message: 'Failed to build integration snapshot',
             error: error.message
         });
     }
@@ -19,23 +19,24 @@ def count_users_in_backup(backup_file):
     print(f"📁 Analyzing: {backup_file}")
     
     try:
-        with open(backup_path, 'r', encoding='utf-8', errors='ignore') as f:
+        # The markers are plain ASCII, so skip decoding the dump
+        with open(backup_path, 'rb') as f:
             content = f.read()
         
         # Count INSERT statements for users
-        insert_pattern = r'INSERT\s+INTO\s+(?:public\.)?users'
+        insert_pattern = rb'INSERT\s+INTO\s+(?:public\.)?users'
         insert_matches = re.findall(insert_pattern, content, re.IGNORECASE)
         insert_count = len(insert_matches)
         
         # Count COPY data lines for users
         copy_count = 0
-        copy_pattern = r'COPY\s+(?:public\.)?users\s+.*?\n(.*?)\\\.'
+        copy_pattern = rb'COPY\s+(?:public\.)?users\s+.*?\n(.*?)\\\.'
         copy_matches = re.findall(copy_pattern, content, re.IGNORECASE | re.DOTALL)
         
         for copy_block in copy_matches:
             # Count non-empty, non-comment lines
-            lines = copy_block.split('\n')
-            data_lines = [line for line in lines if line.strip() and not line.strip().startswith('--')]
+            lines = copy_block.split(b'\n')
+            data_lines = [line for line in lines if line.strip() and not line.strip().startswith(b'--')]
             copy_count += len(data_lines)
         
         total_users = insert_count + copy_count
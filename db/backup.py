@@ -297,8 +297,8 @@ class DatabaseBackup:
         
         return backups
 
-def main():
-    """Main function to handle command line execution"""
+def build_parser():
+    """Build the command line parser"""
     import argparse
     
     parser = argparse.ArgumentParser(description='PostgreSQL Database Backup Tool')
@@ -306,8 +306,11 @@ def main():
                        default='full', help='Type of backup to perform')
     parser.add_argument('--list', action='store_true', help='List existing backups')
     parser.add_argument('--cleanup', action='store_true', help='Clean up old backups only')
-    
-    args = parser.parse_args()
+    return parser
+
+def main(argv=None):
+    """Main function to handle command line execution"""
+    args = build_parser().parse_args(argv)
     
     backup_tool = DatabaseBackup()
     
@@ -590,8 +590,12 @@ class DatabaseRestore:
         except Exception as e:
             self.logger.error(f"Failed to save restore metadata: {e}")
 
-def main():
-    """Main function to handle command line execution"""
+def restore_file(backup_file, force=True, clean=True):
+    """Restore a backup file in-process, returning True on success"""
+    return DatabaseRestore().perform_restore(backup_file, force=force, clean=clean)
+
+def build_parser():
+    """Build the command line parser"""
     import argparse
     
     parser = argparse.ArgumentParser(description='PostgreSQL Database Restore Tool')
@@ -600,8 +604,11 @@ def main():
     parser.add_argument('--force', action='store_true', help='Force restore without prompts')
     parser.add_argument('--no-clean', action='store_true', help='Do not drop/recreate database')
     parser.add_argument('--latest', action='store_true', help='Restore from latest backup')
-    
-    args = parser.parse_args()
+    return parser
+
+def main(argv=None):
+    """Main function to handle command line execution"""
+    args = build_parser().parse_args(argv)
     
     restore_tool = DatabaseRestore()
     
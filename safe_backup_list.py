@@ -3,9 +3,32 @@
 List backup files and their restore safety status
 """
 import os
-import glob
+import re
+import json
+import sys
+import shutil
+import mmap
+import concurrent.futures
+from functools import partial
 from datetime import datetime
 
+# Results for unchanged .sql files are reused from here on later runs
+CACHE_FILENAME = ".backup_safety_cache.json"
+
+# Safety markers are only looked for in the head of the dump
+HEAD_SIZE = 10000
+
+# Backups created after the restore fix carry one of these dates in their name
+RECENT_DATE_RE = re.compile(r'2025-07-(?:09|10)')
+
+# Backups we fixed by hand are tagged FIXED in their name (any case)
+FIXED_RE = re.compile(r'FIXED', re.IGNORECASE)
+
+# All safety markers in one alternation so the head is scanned only once
+SAFETY_MARKERS_RE = re.compile(
+    rb'DROP DATABASE|CREATE DATABASE|DROP TABLE IF EXISTS|DROP TABLE|--clean'
+)
+
 def analyze_backup_safety():
     """Analyze backup files for restore safety"""
     print("🔍 BACKUP FILE RESTORE SAFETY ANALYSIS")
@@ -16,12 +39,11 @@ def analyze_backup_safety():
         print("❌ Backup directory not found")
         return
     
-    # Get all backup files
-    sql_files = glob.glob(os.path.join(backup_dir, "*.sql"))
-    backup_files = glob.glob(os.path.join(backup_dir, "*.backup"))
-    
-    all_files = sql_files + backup_files
-    all_files.sort(key=lambda x: os.path.getmtime(x), reverse=True)
+    # Get all backup files (DirEntry caches stat() for the size/mtime below)
+    with os.scandir(backup_dir) as it:
+        all_files = [entry for entry in it
+                     if entry.is_file() and entry.name.endswith(('.sql', '.backup'))]
+    all_files.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
     
     if not all_files:
         print("❌ No backup files found")
@@ -30,64 +52,129 @@ def analyze_backup_safety():
     print(f"📊 Found {len(all_files)} backup files")
     print()
     
-    safe_files = []
+    # Print safe files as they come in; only unsafe ones are kept for later
+    print("✅ SAFE TO RESTORE (Recommended)")
+    print("-" * 50)
+    
+    safe_count = 0
     unsafe_files = []
+    best_backup = None
+    highest_users = 0
     
-    for file_path in all_files:
-        filename = os.path.basename(file_path)
-        file_size = os.path.getsize(file_path)
-        file_size_mb = file_size / (1024 * 1024)
-        modified_time = datetime.fromtimestamp(os.path.getmtime(file_path))
-        
-        # Analyze file content for safety
-        safety_status = analyze_file_safety(file_path, filename)
-        
-        file_info = {
-            'filename': filename,
-            'size_mb': file_size_mb,
-            'modified': modified_time,
-            'safety': safety_status
-        }
-        
-        if safety_status['safe']:
-            safe_files.append(file_info)
-        else:
-            unsafe_files.append(file_info)
+    cache_path = os.path.join(backup_dir, CACHE_FILENAME)
+    cache = load_cache(cache_path)
+    new_cache = {}
     
-    # Print safe files
-    print("✅ SAFE TO RESTORE (Recommended)")
-    print("-" * 50)
-    if safe_files:
-        for i, file_info in enumerate(safe_files, 1):
-            print(f"{i:2d}. 📄 {file_info['filename']}")
-            print(f"    📊 Size: {file_info['size_mb']:.1f} MB")
-            print(f"    🕐 Modified: {file_info['modified'].strftime('%Y-%m-%d %H:%M:%S')}")
-            print(f"    ✅ Status: {file_info['safety']['reason']}")
-            if file_info['safety']['user_count']:
-                print(f"    👥 Users: {file_info['safety']['user_count']}")
-            print()
-    else:
+    # Each file is independent and mostly waits on disk, so overlap them
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Binary dumps are never opened, so only .sql files go to the pool
+        sql_results = executor.map(partial(_analyze_one, cache=cache),
+                                   [entry for entry in all_files
+                                    if not entry.name.endswith('.backup')])
+        for entry in all_files:
+            if entry.name.endswith('.backup'):
+                file_info = _analyze_one(entry)
+            else:
+                file_info = next(sql_results)
+                _remember(new_cache, entry, file_info['safety'])
+            
+            if not file_info['safety']['safe']:
+                unsafe_files.append(file_info)
+                continue
+            
+            safe_count += 1
+            sys.stdout.write(format_file_info(safe_count, file_info, "✅ Status"))
+            
+            # Track the best backup to use (most users) as we go
+            if file_info['safety']['user_count'] and file_info['safety']['user_count'] > highest_users:
+                highest_users = file_info['safety']['user_count']
+                best_backup = file_info
+    
+    save_cache(cache_path, new_cache)
+    
+    if not safe_count:
         print("❌ No safe backup files found!")
     
     # Print unsafe files
     print("\n⚠️  POTENTIALLY UNSAFE (May Cause Issues)")
     print("-" * 50)
     if unsafe_files:
-        for i, file_info in enumerate(unsafe_files, 1):
-            print(f"{i:2d}. 📄 {file_info['filename']}")
-            print(f"    📊 Size: {file_info['size_mb']:.1f} MB")
-            print(f"    🕐 Modified: {file_info['modified'].strftime('%Y-%m-%d %H:%M:%S')}")
-            print(f"    ⚠️  Issue: {file_info['safety']['reason']}")
-            if file_info['safety']['user_count']:
-                print(f"    👥 Users: {file_info['safety']['user_count']}")
-            print()
+        sys.stdout.write(''.join(format_file_info(i, file_info, "⚠️  Issue")
+                                 for i, file_info in enumerate(unsafe_files, 1)))
     else:
         print("✅ All backup files appear safe!")
     
     # Print recommendations
-    print_recommendations(safe_files, unsafe_files)
+    print_recommendations(safe_count, best_backup, unsafe_files)
 
-def analyze_file_safety(file_path, filename):
+def format_file_info(index, file_info, reason_label):
+    """Render one backup entry as a single block of text"""
+    lines = [
+        f"{index:2d}. 📄 {file_info['filename']}",
+        f"    📊 Size: {file_info['size_mb']:.1f} MB",
+        f"    🕐 Modified: {file_info['modified'].strftime('%Y-%m-%d %H:%M:%S')}",
+        f"    {reason_label}: {file_info['safety']['reason']}",
+    ]
+    if file_info['safety']['user_count']:
+        lines.append(f"    👥 Users: {file_info['safety']['user_count']}")
+    return '\n'.join(lines) + '\n\n'
+
+def load_cache(cache_path):
+    """Load previous analysis results, or start empty if there are none"""
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_cache(cache_path, cache):
+    """Persist analysis results; a read-only backup dir just means no cache"""
+    try:
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+    except OSError:
+        pass
+
+def _cached_safety(cache, entry):
+    """Return the cached safety status if the file hasn't changed since"""
+    cached = cache.get(entry.path)
+    stat = entry.stat()
+    if cached and cached['size'] == stat.st_size and cached['mtime_ns'] == stat.st_mtime_ns:
+        return cached['safety']
+    return None
+
+def _remember(cache, entry, safety_status):
+    """Record a safety status, unless it only reflects a failed read"""
+    if safety_status['reason'].startswith('Error analyzing file'):
+        return
+    stat = entry.stat()
+    cache[entry.path] = {
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'safety': safety_status
+    }
+
+def _analyze_one(entry, cache=None):
+    """Build the file_info dict for a single backup file (an os.DirEntry)"""
+    filename = entry.name
+    stat = entry.stat()
+    file_size_mb = stat.st_size / (1024 * 1024)
+    modified_time = datetime.fromtimestamp(stat.st_mtime)
+    
+    # Analyze file content for safety, unless an earlier run already did
+    safety_status = _cached_safety(cache, entry) if cache else None
+    if safety_status is None:
+        safety_status = analyze_file_safety(entry.path, filename, stat.st_size)
+    
+    return {
+        'filename': filename,
+        'size_mb': file_size_mb,
+        'modified': modified_time,
+        'safety': safety_status
+    }
+
+def analyze_file_safety(file_path, filename, file_size):
     """Analyze a specific backup file for restore safety"""
     try:
         # For .backup files (binary format), assume they're safe
@@ -98,44 +185,42 @@ def analyze_file_safety(file_path, filename):
                 'user_count': None
             }
         
-        # For .sql files, check content
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read(10000)  # Read first 10KB for analysis
-        
-        # Check for safety indicators
-        has_drop_database = 'DROP DATABASE' in content
-        has_create_database = 'CREATE DATABASE' in content
-        has_drop_table = 'DROP TABLE' in content
-        has_clean_flags = '--clean' in content or 'DROP TABLE IF EXISTS' in content
-        
-        # Check if this is the fixed backup we created
-        is_fixed_backup = 'FIXED' in filename.upper()
+        # For .sql files, map the file once and do every check on the mapping
+        # mmap refuses empty files, and there is nothing to scan in them
+        if file_size == 0:
+            scan = scan_backup(b'', filename)
+        else:
+            with open(file_path, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # Hint the kernel to read ahead, the scans below are sequential
+                if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                scan = scan_backup(mm, filename)
         
-        # Count users in the file
-        user_count = count_users_in_backup(file_path)
+        user_count = scan['user_count']
         
         # Determine safety
-        if is_fixed_backup:
+        if scan['is_fixed_backup']:
             return {
                 'safe': True,
                 'reason': 'Fixed backup with proper DROP statements',
                 'user_count': user_count
             }
-        elif has_drop_database:
+        elif scan['has_drop_database']:
             return {
                 'safe': True,
                 'reason': 'Contains DROP DATABASE statement',
                 'user_count': user_count
             }
-        elif has_drop_table or has_clean_flags:
+        elif scan['has_drop_table'] or scan['has_clean_flags']:
             return {
                 'safe': True,
                 'reason': 'Contains DROP TABLE statements',
                 'user_count': user_count
             }
-        elif 'CREATE DATABASE' in content and user_count and user_count > 1000:
+        elif scan['has_create_database'] and user_count and user_count > 1000:
             # Newer backups created with our improved system
-            created_after_fix = any(date in filename for date in ['2025-07-09', '2025-07-10'])
+            created_after_fix = RECENT_DATE_RE.search(filename) is not None
             if created_after_fix:
                 return {
                     'safe': True,
@@ -162,45 +247,50 @@ def analyze_file_safety(file_path, filename):
             'user_count': None
         }
 
-def count_users_in_backup(file_path):
-    """Count users in a backup file"""
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Count INSERT statements for users
-        insert_count = content.count('INSERT INTO users') + content.count('INSERT INTO public.users')
-        
-        # Count COPY data lines for users
-        copy_start = content.find('COPY public.users')
-        if copy_start != -1:
-            copy_end = content.find('\\.', copy_start)
-            if copy_end != -1:
-                users_section = content[copy_start:copy_end]
-                copy_lines = users_section.split('\n')[1:]  # Skip header
-                copy_count = len([line for line in copy_lines if line.strip()])
-                return copy_count
-        
-        return insert_count if insert_count > 0 else None
-        
-    except Exception:
-        return None
+def _mmap_count(mm, needle):
+    """Count non-overlapping occurrences of needle in a mmap (mmap has no count())"""
+    count = 0
+    pos = mm.find(needle)
+    while pos != -1:
+        count += 1
+        pos = mm.find(needle, pos + len(needle))
+    return count
+
+def scan_backup(mm, filename):
+    """Collect safety markers and the user count from a mapped .sql backup (or bytes)"""
+    head_end = min(HEAD_SIZE, len(mm))
+    found = {match.group() for match in SAFETY_MARKERS_RE.finditer(mm, 0, head_end)}
+    
+    return {
+        'has_drop_database': b'DROP DATABASE' in found,
+        'has_create_database': b'CREATE DATABASE' in found,
+        'has_drop_table': b'DROP TABLE' in found or b'DROP TABLE IF EXISTS' in found,
+        'has_clean_flags': b'--clean' in found or b'DROP TABLE IF EXISTS' in found,
+        # Check if this is the fixed backup we created
+        'is_fixed_backup': FIXED_RE.search(filename) is not None,
+        'user_count': count_users(mm)
+    }
 
-def print_recommendations(safe_files, unsafe_files):
+def count_users(mm):
+    """Count users in a mapped backup file"""
+    # Count COPY data lines for users; only the COPY block itself is touched
+    copy_start = mm.find(b'COPY public.users')
+    if copy_start != -1:
+        copy_end = mm.find(b'\\.', copy_start)
+        if copy_end != -1:
+            # One data row per line, minus the COPY header line
+            return max(0, mm[copy_start:copy_end].count(b'\n') - 1)
+    
+    # Fall back to counting INSERT statements for users
+    insert_count = _mmap_count(mm, b'INSERT INTO users') + _mmap_count(mm, b'INSERT INTO public.users')
+    return insert_count if insert_count > 0 else None
+
+def print_recommendations(safe_count, best_backup, unsafe_files):
     """Print recommendations for backup usage"""
     print("\n🎯 RECOMMENDATIONS")
     print("=" * 70)
     
-    if safe_files:
-        # Find the best backup to use
-        best_backup = None
-        highest_users = 0
-        
-        for file_info in safe_files:
-            if file_info['safety']['user_count'] and file_info['safety']['user_count'] > highest_users:
-                highest_users = file_info['safety']['user_count']
-                best_backup = file_info
-        
+    if safe_count:
         if best_backup:
             print(f"🏆 RECOMMENDED BACKUP:")
             print(f"   📄 File: {best_backup['filename']}")
@@ -233,55 +323,9 @@ def print_recommendations(safe_files, unsafe_files):
 
 def create_restore_script():
     """Create a script for safe restoration"""
-    script_content = '''#!/usr/bin/env python3
-"""
-Safe restore script - only uses verified safe backup files
-"""
-import requests
-import json
-
-# Use the recommended safe backup file
-SAFE_BACKUP_FILE = "ecommerce_backup_FIXED_MANUAL_2025-07-10_05-32-48.sql"
-BASE_URL = "http://localhost:3001"
-
-def safe_restore():
-    """Perform safe restore using verified backup"""
-    print(f"🔧 Starting SAFE restore with: {SAFE_BACKUP_FILE}")
-    
-    # Login first
-    login_response = requests.post(f"{BASE_URL}/api/users/login", json={
-        "email": "admin@example.com",
-        "password": "admin123"
-    })
-    
-    if login_response.status_code != 200:
-        print("❌ Login failed")
-        return False
-    
-    token = login_response.json()["data"]["token"]
-    headers = {"Authorization": f"Bearer {token}"}
-    
-    # Perform restore
-    restore_response = requests.post(f"{BASE_URL}/api/database/restore", 
-                                   json={"filename": SAFE_BACKUP_FILE}, 
-                                   headers=headers)
-    
-    if restore_response.status_code == 200:
-        result = restore_response.json()
-        verification = result["data"]["verification"]
-        print(f"✅ Restore successful!")
-        print(f"👥 Users restored: {verification.get('userCount', 'Unknown')}")
-        return True
-    else:
-        print(f"❌ Restore failed: {restore_response.text}")
-        return False
-
-if __name__ == "__main__":
-    safe_restore()
-'''
-    
-    with open('safe_restore.py', 'w') as f:
-        f.write(script_content)
+    template_path = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                 'templates', 'safe_restore.py.tmpl')
+    shutil.copyfile(template_path, 'safe_restore.py')
     
     print(f"\n💾 Created safe_restore.py script")
     print(f"   Run with: python safe_restore.py")
@@ -5,8 +5,10 @@ Add Default Admin User Without Clearing Data
 
 import os
 import psycopg2
+from psycopg2.extras import execute_values
 import bcrypt
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from dotenv import load_dotenv
 
@@ -22,6 +24,8 @@ def create_admin_user():
         'password': os.getenv('DB_PASSWORD', 'hengmengly123')
     }
     
+    # One connection and one transaction for the check and the insert
+    conn = None
     try:
         conn = psycopg2.connect(**db_config)
         cursor = conn.cursor()
@@ -34,53 +38,57 @@ def create_admin_user():
             print("✅ Admin user already exists!")
             return
         
-        # Create admin user
+        # Create admin and staff users in a single INSERT
         admin_id = str(uuid.uuid4())
-        password_hash = bcrypt.hashpw('admin123'.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+        staff_id = str(uuid.uuid4())
         
-        cursor.execute("""
-            INSERT INTO users (user_id, username, email, password_hash, first_name, last_name, 
-                             phone, date_of_birth, created_at, role, is_active)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """, (
-            admin_id,
-            'admin',
-            'admin@example.com',
-            password_hash,
-            'Admin',
-            'User',
-            '+1234567890',
-            '1990-01-01',
-            datetime.now(),
-            'admin',
-            True
-        ))
+        # bcrypt releases the GIL while hashing, so both hashes run side by side
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            admin_future = executor.submit(bcrypt.hashpw, 'admin123'.encode('utf-8'), bcrypt.gensalt())
+            staff_future = executor.submit(bcrypt.hashpw, 'staff123'.encode('utf-8'), bcrypt.gensalt())
+            password_hash = admin_future.result().decode('utf-8')
+            staff_password_hash = staff_future.result().decode('utf-8')
         
-        # Create staff user
-        staff_id = str(uuid.uuid4())
-        staff_password_hash = bcrypt.hashpw('staff123'.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+        # Both accounts share the same creation moment
+        created_at = datetime.now()
+        
+        rows = [
+            (
+                admin_id,
+                'admin',
+                'admin@example.com',
+                password_hash,
+                'Admin',
+                'User',
+                '+1234567890',
+                '1990-01-01',
+                created_at,
+                'admin',
+                True
+            ),
+            (
+                staff_id,
+                'staff',
+                'staff@example.com',
+                staff_password_hash,
+                'Staff',
+                'User',
+                '+1234567891',
+                '1990-01-01',
+                created_at,
+                'staff',
+                True
+            )
+        ]
         
-        cursor.execute("""
+        execute_values(cursor, """
             INSERT INTO users (user_id, username, email, password_hash, first_name, last_name, 
                              phone, date_of_birth, created_at, role, is_active)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """, (
-            staff_id,
-            'staff',
-            'staff@example.com',
-            staff_password_hash,
-            'Staff',
-            'User',
-            '+1234567891',
-            '1990-01-01',
-            datetime.now(),
-            'staff',
-            True
-        ))
+            VALUES %s
+        """, rows)
         
         conn.commit()
         cursor.close()
-        conn.close()
         
         print("✅ Admin and Staff users created successfully!")
         print("   🔒 Admin: admin@example.com / admin123")
@@ -88,6 +96,9 @@ def create_admin_user():
         
     except Exception as e:
         print(f"❌ Error creating admin user: {e}")
+    finally:
+        if conn is not None:
+            conn.close()
 
 if __name__ == "__main__":
     create_admin_user()
@@ -8,27 +8,246 @@ import os
 import sys
 import time
 import random
-import uuid
+import json
+import multiprocessing
 from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import psycopg2
-from psycopg2.extras import execute_batch
+from psycopg2.extras import execute_values
 from faker import Faker
 from tqdm import tqdm
 from dotenv import load_dotenv
 
+from pg_copy import (copy_stream, uuid4_bulk, apply_bulk_load_settings, raise_max_wal_size,
+                     restore_max_wal_size, drop_load_constraints, rebuild_load_constraints)
+
 # Load environment variables
 load_dotenv()
 
+# Every generated user gets this hash of 'password123'
+PASSWORD_HASH = '$2b$10$rKjw.6QxEQsxZ5GvKjQxHOqXcXPKXP8Zd8WcE7Y3qYzRxZqK9WqDC'
+
+# Spans for random timestamps, in seconds
+SIX_MONTHS = 182 * 24 * 3600
+ONE_YEAR = 365 * 24 * 3600
+TWO_YEARS = 2 * ONE_YEAR
+
+def random_past_datetime(seconds_back: int) -> datetime:
+    """Return a random datetime within the last seconds_back seconds"""
+    return datetime.fromtimestamp(time.time() - random.random() * seconds_back)
+
+# Faker instance of the current process, created on first use and inherited by forked workers
+_worker_fake = None
+
+def get_worker_fake() -> Faker:
+    """Return this process's Faker instance"""
+    global _worker_fake
+    if _worker_fake is None:
+        _worker_fake = Faker()
+        _worker_fake.seed_instance(random.getrandbits(64))
+    return _worker_fake
+
+# User ids that order rows pick from, handed to each worker once by init_worker
+_user_ids = []
+
+def init_worker(user_ids: List[str] = None):
+    """Reseed the inherited Faker so forked workers don't repeat each other's values"""
+    global _user_ids
+    # random itself is reseeded after fork, Faker's own Random instance is not
+    get_worker_fake().seed_instance(random.getrandbits(64))
+    # Forked workers inherit the parent's pools, spawned ones build their own here
+    get_faker_pools()
+    if user_ids is not None:
+        _user_ids = user_ids
+
+# How many values to pre-generate per Faker method; rows pick from these pools
+FAKER_POOL_SIZES = {
+    'first_name': 5000,
+    'last_name': 5000,
+    'phone_number': 10000,
+    'domain_name': 500,
+    'catch_phrase': 5000,
+    'image_url': 2000,
+    'street_address': 20000,
+    'city': 10000,
+    'state': 1000,
+    'zipcode': 10000,
+    'country': 1000,
+    'url': 2000
+}
+
+# How many pre-serialized JSON addresses to keep for orders
+ADDRESS_POOL_SIZE = 50000
+
+# Filler text pools: pool name -> (max_nb_chars, size); the text needn't be unique
+TEXT_POOL_SIZES = {
+    'text_100': (100, 2000),
+    'text_200': (200, 2000),
+    'text_500': (500, 2000)
+}
+
+# Faker value pools of the current process, built on first use
+_faker_pools = None
+
+def get_faker_pools() -> Dict[str, List[str]]:
+    """Return this process's pools of pre-generated Faker values"""
+    global _faker_pools
+    if _faker_pools is None:
+        fake = get_worker_fake()
+        _faker_pools = {
+            method: [getattr(fake, method)() for _ in range(size)]
+            for method, size in FAKER_POOL_SIZES.items()
+        }
+        # Order addresses are stored already JSON-encoded, rows paste them as-is
+        _faker_pools['address_json'] = [
+            json.dumps({
+                "street": random.choice(_faker_pools['street_address']),
+                "city": random.choice(_faker_pools['city']),
+                "state": random.choice(_faker_pools['state']),
+                "zip": random.choice(_faker_pools['zipcode']),
+                "country": random.choice(_faker_pools['country'])
+            })
+            for _ in range(ADDRESS_POOL_SIZE)
+        ]
+        for name, (max_nb_chars, size) in TEXT_POOL_SIZES.items():
+            _faker_pools[name] = [fake.text(max_nb_chars=max_nb_chars) for _ in range(size)]
+        _faker_pools['sentence'] = [fake.sentence(nb_words=6) for _ in range(2000)]
+    return _faker_pools
+
+def build_user_rows(start: int, user_ids: List[str]) -> Iterator[tuple]:
+    """Yield user rows for one shard; start is the shard's first row number
+
+    password_hash is left out, the column default supplies PASSWORD_HASH during the load.
+    """
+    fake = get_worker_fake()
+    pools = get_faker_pools()
+    
+    # 95% customers, 4.5% staff, 0.5% admin
+    user_roles = random.choices(['customer', 'staff', 'admin'], weights=[950, 45, 5], k=len(user_ids))
+    
+    for offset, user_id in enumerate(user_ids):
+        i = start + offset
+        first_name = random.choice(pools['first_name'])
+        last_name = random.choice(pools['last_name'])
+        username = f"{first_name.lower()}.{last_name.lower()}.{i}"  # i keeps it unique
+        email = f"{username}@{random.choice(pools['domain_name'])}"
+        
+        yield (
+            user_id,
+            username,
+            email,
+            first_name,
+            last_name,
+            random.choice(pools['phone_number']),
+            fake.date_of_birth(minimum_age=18, maximum_age=80),
+            random_past_datetime(TWO_YEARS),
+            user_roles[offset]
+        )
+
+def build_product_rows(start: int, product_ids: List[str], category_ids: List[str],
+                       brands: List[str]) -> Iterator[tuple]:
+    """Yield product rows for one shard; start is the shard's first row number"""
+    pools = get_faker_pools()
+    materials = ["Cotton", "Polyester", "Plastic", "Metal", "Wood", "Glass", "Leather", "Silk"]
+    colors = ["Red", "Blue", "Green", "Black", "White", "Gray", "Brown", "Yellow", "Pink", "Purple"]
+    
+    # Draw the categorical columns for the whole shard up front
+    n = len(product_ids)
+    product_categories = random.choices(category_ids, k=n)
+    product_brands = random.choices(brands, k=n)
+    product_colors = random.choices(colors, k=n)
+    product_materials = random.choices(materials, k=n)
+    product_active = random.choices([True, False], weights=[3, 1], k=n)  # 75% active
+    
+    for offset, product_id in enumerate(product_ids):
+        i = start + offset
+        yield (
+            product_id,
+            random.choice(pools['catch_phrase']),
+            random.choice(pools['text_500']),
+            product_categories[offset],
+            product_brands[offset],
+            f"SKU-{i:08d}",
+            round(random.uniform(9.99, 999.99), 2),
+            round(random.uniform(0, 50), 2),  # discount
+            random.randint(0, 1000),  # stock
+            round(random.uniform(0.1, 50.0), 2),  # weight
+            f"{random.randint(10, 100)}x{random.randint(10, 100)}x{random.randint(5, 50)}cm",
+            product_colors[offset],
+            product_materials[offset],
+            random.choices(pools['image_url'], k=random.randint(1, 5)),  # image array
+            product_active[offset],
+            random_past_datetime(ONE_YEAR)
+        )
+
+def build_order_rows(start: int, order_ids: List[str]) -> Iterator[tuple]:
+    """Yield order rows for one shard; start is the shard's first row number"""
+    pools = get_faker_pools()
+    statuses = ["pending", "confirmed", "processing", "shipped", "delivered", "cancelled"]
+    payment_methods = ["credit_card", "debit_card", "paypal", "stripe", "cash_on_delivery"]
+    
+    # Draw the categorical columns for the whole shard up front
+    n = len(order_ids)
+    order_users = random.choices(_user_ids, k=n)
+    order_statuses = random.choices(statuses, k=n)
+    order_payment_methods = random.choices(payment_methods, k=n)
+    
+    for offset, order_id in enumerate(order_ids):
+        i = start + offset
+        total_amount = round(random.uniform(25.00, 2000.00), 2)
+        discount_amount = round(total_amount * random.uniform(0, 0.3), 2)
+        tax_amount = round(total_amount * 0.08, 2)  # 8% tax
+        shipping_cost = round(random.uniform(5.99, 29.99), 2)
+        final_amount = round(total_amount - discount_amount + tax_amount + shipping_cost, 2)
+        
+        yield (
+            order_id,
+            order_users[offset],
+            f"ORD-{i:08d}",
+            order_statuses[offset],
+            total_amount,
+            discount_amount,
+            tax_amount,
+            shipping_cost,
+            final_amount,
+            "USD",
+            order_payment_methods[offset],
+            random.choice(pools['address_json']),  # shipping_address
+            random.choice(pools['address_json']),  # billing_address
+            random.choice(pools['text_100']) if random.random() < 0.3 else None,
+            random_past_datetime(ONE_YEAR)
+        )
+
+def copy_shard(db_config: Dict[str, Any], table: str, columns: List[str],
+               build_rows, args: tuple, column_types: List[str] = None) -> int:
+    """Stream one shard of rows into COPY on this worker's own connection"""
+    conn = psycopg2.connect(**db_config)
+    try:
+        with conn.cursor() as cursor:
+            apply_bulk_load_settings(cursor)
+            count = copy_stream(cursor, table, columns, build_rows(*args),
+                                column_types=column_types)
+        conn.commit()
+    finally:
+        conn.close()
+    return count
+
 class DatabaseDataGenerator:
     def __init__(self):
-        self.fake = Faker()
+        self.fake = get_worker_fake()
         self.conn = None
         self.cursor = None
         
         # Configuration
-        self.BATCH_SIZE = 1000
+        self.BATCH_SIZE = 10_000
         self.TARGET_RECORDS_PER_TABLE = 1_000_000
+        self.COMMIT_EVERY_BATCHES = 50  # INSERT fallback commits this often
+        self.WORKERS = 4  # Processes (and connections) for the large tables
+        self.LOAD_TABLES = [
+            'users', 'categories', 'products', 'product_sizes', 'cart',
+            'orders', 'notifications', 'favorites', 'payments'
+        ]
         
         # Connection parameters
         self.db_config = {
@@ -39,13 +258,11 @@ class DatabaseDataGenerator:
             'password': os.getenv('DB_PASSWORD', 'password')
         }
         
-        # Data storage for foreign key relationships
+        # Data storage for foreign key relationships (only ids later tables reference)
         self.generated_data = {
             'user_ids': [],
             'category_ids': [],
             'product_ids': [],
-            'size_ids': [],
-            'cart_ids': [],
             'order_ids': []
         }
 
@@ -56,6 +273,9 @@ class DatabaseDataGenerator:
             self.cursor = self.conn.cursor()
             print("✅ Connected to PostgreSQL database")
             
+            # Optimize for bulk inserts
+            apply_bulk_load_settings(self.cursor)
+            
             # Test connection
             self.cursor.execute("SELECT version();")
             version = self.cursor.fetchone()
@@ -74,59 +294,106 @@ class DatabaseDataGenerator:
         print("🔌 Database connection closed")
 
     def execute_batch_insert(self, query: str, data: List[tuple], description: str):
-        """Execute batch insert with progress tracking"""
+        """Execute batch insert with progress tracking (query must end in VALUES %s)"""
         try:
-            total_batches = len(data) // self.BATCH_SIZE + (1 if len(data) % self.BATCH_SIZE else 0)
-            
             with tqdm(total=len(data), desc=description, unit='records') as pbar:
-                for i in range(0, len(data), self.BATCH_SIZE):
+                for batch_number, i in enumerate(range(0, len(data), self.BATCH_SIZE), 1):
                     batch = data[i:i + self.BATCH_SIZE]
-                    execute_batch(self.cursor, query, batch, page_size=self.BATCH_SIZE)
-                    self.conn.commit()
+                    execute_values(self.cursor, query, batch, page_size=self.BATCH_SIZE)
                     pbar.update(len(batch))
                     
+                    # Checkpoint now and then so a crash doesn't lose a whole large table
+                    if batch_number % self.COMMIT_EVERY_BATCHES == 0:
+                        self.conn.commit()
+            
+            self.conn.commit()
+                    
         except Exception as e:
             print(f"❌ Error in batch insert for {description}: {e}")
             self.conn.rollback()
             raise
 
+    def copy_insert(self, table: str, columns: List[str], rows: Iterator[tuple], total: int,
+                    description: str, column_types: List[str] = None) -> int:
+        """Stream rows from an iterator into a table through COPY with progress tracking
+
+        Passing column_types switches the table to binary COPY.
+        """
+        try:
+            with tqdm(total=total, desc=description, unit='records') as pbar:
+                count = copy_stream(self.cursor, table, columns, rows, on_flush=pbar.update,
+                                    column_types=column_types)
+            
+            # One commit per table
+            self.conn.commit()
+            return count
+                    
+        except Exception as e:
+            print(f"❌ Error in COPY for {description}: {e}")
+            self.conn.rollback()
+            raise
+
+    def parallel_copy_insert(self, table: str, columns: List[str], build_rows,
+                             shard_args: List[tuple], total: int, description: str,
+                             column_types: List[str] = None, user_ids: List[str] = None):
+        """Build and COPY shards of a table in worker processes, one connection each
+
+        user_ids is handed to each worker once at startup rather than with every shard.
+        """
+        # Build Faker and its pools before forking so workers share them copy-on-write;
+        # where fork isn't available (Windows) workers are spawned and build their own
+        get_faker_pools()
+        start_method = 'fork' if 'fork' in multiprocessing.get_all_start_methods() else None
+        with ProcessPoolExecutor(max_workers=self.WORKERS,
+                                 mp_context=multiprocessing.get_context(start_method),
+                                 initializer=init_worker, initargs=(user_ids,)) as executor:
+            futures = [
+                executor.submit(copy_shard, self.db_config, table, columns, build_rows, args,
+                                column_types)
+                for args in shard_args
+            ]
+            
+            with tqdm(total=total, desc=description, unit='records') as pbar:
+                for future in as_completed(futures):
+                    try:
+                        pbar.update(future.result())
+                    except Exception as e:
+                        print(f"❌ Error in parallel COPY for {description}: {e}")
+                        raise
+
+    def shard_ranges(self, count: int) -> List[tuple]:
+        """Split range(count) into one contiguous (start, stop) range per worker"""
+        shard_size = max(1, -(-count // self.WORKERS))
+        return [(start, min(start + shard_size, count)) for start in range(0, count, shard_size)]
+
     def generate_users(self, count: int = 1_000_000):
         """Generate user records"""
         print(f"\n🧑‍💼 Generating {count:,} users...")
         
-        users_data = []
-        roles = ['customer'] * 950000 + ['staff'] * 45000 + ['admin'] * 5000  # 95% customers, 4.5% staff, 0.5% admin
-        random.shuffle(roles)
+        # Ids are allocated here so the parent keeps them for foreign keys
+        user_ids = uuid4_bulk(count)
+        self.generated_data['user_ids'].extend(user_ids)
         
-        for i in range(count):
-            user_id = str(uuid.uuid4())
-            self.generated_data['user_ids'].append(user_id)
-            
-            first_name = self.fake.first_name()
-            last_name = self.fake.last_name()
-            username = f"{first_name.lower()}.{last_name.lower()}.{i}"
-            email = f"{username}@{self.fake.domain_name()}"
-            
-            users_data.append((
-                user_id,
-                username,
-                email,
-                '$2b$10$rKjw.6QxEQsxZ5GvKjQxHOqXcXPKXP8Zd8WcE7Y3qYzRxZqK9WqDC',  # hashed 'password123'
-                first_name,
-                last_name,
-                self.fake.phone_number(),
-                self.fake.date_of_birth(minimum_age=18, maximum_age=80),
-                self.fake.date_time_between(start_date='-2y', end_date='now'),
-                roles[i % len(roles)]
-            ))
+        shard_args = [
+            (start, user_ids[start:stop])
+            for start, stop in self.shard_ranges(count)
+        ]
         
-        query = """
-            INSERT INTO users (user_id, username, email, password_hash, first_name, last_name, 
-                             phone, date_of_birth, created_at, role)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """
+        columns = [
+            'user_id', 'username', 'email', 'first_name',
+            'last_name', 'phone', 'date_of_birth', 'created_at', 'role'
+        ]
         
-        self.execute_batch_insert(query, users_data, "Inserting users")
+        # The shared hash is sent once as a temporary column default, not on every row
+        self.cursor.execute("ALTER TABLE users ALTER COLUMN password_hash SET DEFAULT %s",
+                            (PASSWORD_HASH,))
+        self.conn.commit()
+        try:
+            self.parallel_copy_insert('users', columns, build_user_rows, shard_args, count,
+                                      "Inserting users")
+        finally:
+            self.cursor.execute("ALTER TABLE users ALTER COLUMN password_hash DROP DEFAULT")
+            self.conn.commit()
         print(f"✅ Generated {count:,} users")
 
     def generate_categories(self, count: int = 1000):
@@ -141,46 +408,44 @@ class DatabaseDataGenerator:
         ]
         
         categories_data = []
-        parent_category_ids = []
+        pools = get_faker_pools()
+        
+        # Root categories take the first ids, subcategories the rest
+        category_ids = uuid4_bulk(max(count, len(base_categories)))
+        self.generated_data['category_ids'].extend(category_ids)
+        parent_category_ids = category_ids[:len(base_categories)]
         
         # Generate root categories
-        for name in base_categories:
-            category_id = str(uuid.uuid4())
-            self.generated_data['category_ids'].append(category_id)
-            parent_category_ids.append(category_id)
-            
+        for name, category_id in zip(base_categories, parent_category_ids):
             categories_data.append((
                 category_id,
                 name,
-                self.fake.text(max_nb_chars=200),
+                random.choice(pools['text_200']),
                 None,  # parent_category_id
                 self.fake.image_url(),
                 True,
-                self.fake.date_time_between(start_date='-1y', end_date='now')
+                random_past_datetime(ONE_YEAR)
             ))
         
         # Generate subcategories
-        for i in range(count - len(base_categories)):
-            category_id = str(uuid.uuid4())
-            self.generated_data['category_ids'].append(category_id)
-            
+        for category_id in category_ids[len(base_categories):]:
             categories_data.append((
                 category_id,
                 self.fake.bs().title(),
-                self.fake.text(max_nb_chars=200),
+                random.choice(pools['text_200']),
                 random.choice(parent_category_ids) if random.random() < 0.7 else None,
                 self.fake.image_url(),
                 random.choice([True, True, True, False]),  # 75% active
-                self.fake.date_time_between(start_date='-1y', end_date='now')
+                random_past_datetime(ONE_YEAR)
             ))
         
-        query = """
-            INSERT INTO categories (category_id, name, description, parent_category_id, 
-                                  image_url, is_active, created_at)
-            VALUES (%s, %s, %s, %s, %s, %s, %s)
-        """
+        columns = [
+            'category_id', 'name', 'description', 'parent_category_id',
+            'image_url', 'is_active', 'created_at'
+        ]
         
-        self.execute_batch_insert(query, categories_data, "Inserting categories")
+        self.copy_insert('categories', columns, iter(categories_data), len(categories_data),
+                         "Inserting categories")
         print(f"✅ Generated {count:,} categories")
 
     def generate_products(self, count: int = 1_000_000):
@@ -192,42 +457,30 @@ class DatabaseDataGenerator:
             "Microsoft", "Google", "Amazon", "Tesla", "BMW", "Mercedes", "Toyota"
         ] + [self.fake.company() for _ in range(50)]
         
-        materials = ["Cotton", "Polyester", "Plastic", "Metal", "Wood", "Glass", "Leather", "Silk"]
-        colors = ["Red", "Blue", "Green", "Black", "White", "Gray", "Brown", "Yellow", "Pink", "Purple"]
-        
-        products_data = []
+        product_ids = uuid4_bulk(count)
+        self.generated_data['product_ids'].extend(product_ids)
         
-        for i in range(count):
-            product_id = str(uuid.uuid4())
-            self.generated_data['product_ids'].append(product_id)
-            
-            products_data.append((
-                product_id,
-                self.fake.catch_phrase(),
-                self.fake.text(max_nb_chars=500),
-                random.choice(self.generated_data['category_ids']),
-                random.choice(brands),
-                f"SKU-{i:08d}",
-                round(random.uniform(9.99, 999.99), 2),
-                round(random.uniform(0, 50), 2),  # discount
-                random.randint(0, 1000),  # stock
-                round(random.uniform(0.1, 50.0), 2),  # weight
-                f"{random.randint(10, 100)}x{random.randint(10, 100)}x{random.randint(5, 50)}cm",
-                random.choice(colors),
-                random.choice(materials),
-                [self.fake.image_url() for _ in range(random.randint(1, 5))],  # image array
-                random.choice([True, True, True, False]),  # 75% active
-                self.fake.date_time_between(start_date='-1y', end_date='now')
-            ))
+        shard_args = [
+            (start, product_ids[start:stop], self.generated_data['category_ids'], brands)
+            for start, stop in self.shard_ranges(count)
+        ]
         
-        query = """
-            INSERT INTO products (product_id, name, description, category_id, brand, sku, 
-                                base_price, discount_percentage, stock_quantity, weight, 
-                                dimensions, color, material, image_urls, is_active, created_at)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """
+        columns = [
+            'product_id', 'name', 'description', 'category_id', 'brand', 'sku',
+            'base_price', 'discount_percentage', 'stock_quantity', 'weight',
+            'dimensions', 'color', 'material', 'image_urls', 'is_active',
+            'created_at'
+        ]
+        # Numeric-heavy table: binary COPY spares the server parsing every price
+        column_types = [
+            'uuid', 'text', 'text', 'uuid', 'text', 'text',
+            'numeric', 'numeric', 'int4', 'numeric',
+            'text', 'text', 'text', 'text[]', 'bool',
+            'timestamp'
+        ]
         
-        self.execute_batch_insert(query, products_data, "Inserting products")
+        self.parallel_copy_insert('products', columns, build_product_rows, shard_args, count,
+                                  "Inserting products", column_types)
         print(f"✅ Generated {count:,} products")
 
     def generate_product_sizes(self, count: int = 3_000_000):
@@ -236,123 +489,95 @@ class DatabaseDataGenerator:
         
         sizes = ["XS", "S", "M", "L", "XL", "XXL", "6", "7", "8", "9", "10", "11", "12"]
         
-        sizes_data = []
         products_sample = random.sample(self.generated_data['product_ids'], 
                                       min(count // 3, len(self.generated_data['product_ids'])))
         
+        # Pick the (product, size) pairs first so their ids come in one bulk call
+        size_pairs = []
         for product_id in products_sample:
             num_sizes = random.randint(1, 5)
             product_sizes = random.sample(sizes, min(num_sizes, len(sizes)))
-            
-            for size in product_sizes:
-                if len(sizes_data) >= count:
-                    break
-                    
-                size_id = str(uuid.uuid4())
-                self.generated_data['size_ids'].append(size_id)
-                
-                sizes_data.append((
-                    size_id,
-                    product_id,
-                    size,
-                    size,
-                    round(random.uniform(0, 20), 2),  # additional price
-                    random.randint(0, 100),  # stock
-                    self.fake.date_time_between(start_date='-1y', end_date='now')
-                ))
-        
-        query = """
-            INSERT INTO product_sizes (size_id, product_id, size_name, size_value, 
-                                     additional_price, stock_quantity, created_at)
-            VALUES (%s, %s, %s, %s, %s, %s, %s)
-        """
+            size_pairs.extend((product_id, size) for size in product_sizes)
+        del size_pairs[count:]
+        
+        sizes_data = (
+            (
+                size_id,
+                product_id,
+                size,
+                size,
+                round(random.uniform(0, 20), 2),  # additional price
+                random.randint(0, 100),  # stock
+                random_past_datetime(ONE_YEAR)
+            )
+            for size_id, (product_id, size) in zip(uuid4_bulk(len(size_pairs)), size_pairs)
+        )
+        
+        columns = [
+            'size_id', 'product_id', 'size_name', 'size_value',
+            'additional_price', 'stock_quantity', 'created_at'
+        ]
+        column_types = [
+            'uuid', 'uuid', 'text', 'text',
+            'numeric', 'int4', 'timestamp'
+        ]
         
-        self.execute_batch_insert(query, sizes_data, "Inserting product sizes")
-        print(f"✅ Generated {len(sizes_data):,} product sizes")
+        inserted = self.copy_insert('product_sizes', columns, sizes_data, len(size_pairs),
+                                    "Inserting product sizes", column_types)
+        print(f"✅ Generated {inserted:,} product sizes")
 
     def generate_carts(self, count: int = 800_000):
         """Generate shopping cart records"""
         print(f"\n🛒 Generating {count:,} shopping carts...")
         
-        carts_data = []
         users_sample = random.sample(self.generated_data['user_ids'], 
                                    min(count, len(self.generated_data['user_ids'])))
         
-        for user_id in users_sample:
-            cart_id = str(uuid.uuid4())
-            self.generated_data['cart_ids'].append(cart_id)
-            
-            carts_data.append((
+        carts_data = (
+            (
                 cart_id,
                 user_id,
-                self.fake.date_time_between(start_date='-6m', end_date='now')
-            ))
+                random_past_datetime(SIX_MONTHS)
+            )
+            for cart_id, user_id in zip(uuid4_bulk(len(users_sample)), users_sample)
+        )
         
-        query = """
-            INSERT INTO cart (cart_id, user_id, created_at)
-            VALUES (%s, %s, %s)
-        """
+        columns = [
+            'cart_id', 'user_id', 'created_at'
+        ]
         
-        self.execute_batch_insert(query, carts_data, "Inserting shopping carts")
-        print(f"✅ Generated {len(carts_data):,} shopping carts")
+        inserted = self.copy_insert('cart', columns, carts_data, len(users_sample),
+                                    "Inserting shopping carts")
+        print(f"✅ Generated {inserted:,} shopping carts")
 
     def generate_orders(self, count: int = 2_000_000):
         """Generate order records"""
         print(f"\n📦 Generating {count:,} orders...")
         
-        statuses = ["pending", "confirmed", "processing", "shipped", "delivered", "cancelled"]
-        payment_methods = ["credit_card", "debit_card", "paypal", "stripe", "cash_on_delivery"]
-        
-        orders_data = []
+        order_ids = uuid4_bulk(count)
+        self.generated_data['order_ids'].extend(order_ids)
         
-        for i in range(count):
-            order_id = str(uuid.uuid4())
-            self.generated_data['order_ids'].append(order_id)
-            
-            total_amount = round(random.uniform(25.00, 2000.00), 2)
-            discount_amount = round(total_amount * random.uniform(0, 0.3), 2)
-            tax_amount = round(total_amount * 0.08, 2)  # 8% tax
-            shipping_cost = round(random.uniform(5.99, 29.99), 2)
-            final_amount = round(total_amount - discount_amount + tax_amount + shipping_cost, 2)
-            
-            orders_data.append((
-                order_id,
-                random.choice(self.generated_data['user_ids']),
-                f"ORD-{i:08d}",
-                random.choice(statuses),
-                total_amount,
-                discount_amount,
-                tax_amount,
-                shipping_cost,
-                final_amount,
-                "USD",
-                random.choice(payment_methods),
-                {
-                    "street": self.fake.street_address(),
-                    "city": self.fake.city(),
-                    "state": self.fake.state(),
-                    "zip": self.fake.zipcode(),
-                    "country": self.fake.country()
-                },
-                {
-                    "street": self.fake.street_address(),
-                    "city": self.fake.city(),
-                    "state": self.fake.state(),
-                    "zip": self.fake.zipcode(),
-                    "country": self.fake.country()
-                },
-                self.fake.text(max_nb_chars=100) if random.random() < 0.3 else None,
-                self.fake.date_time_between(start_date='-1y', end_date='now')
-            ))
+        shard_args = [
+            (start, order_ids[start:stop])
+            for start, stop in self.shard_ranges(count)
+        ]
         
-        query = """
-            INSERT INTO orders (order_id, user_id, order_number, order_status, total_amount,
-                              discount_amount, tax_amount, shipping_cost, final_amount, currency,
-                              payment_method, shipping_address, billing_address, notes, created_at)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """
+        columns = [
+            'order_id', 'user_id', 'order_number', 'order_status',
+            'total_amount', 'discount_amount', 'tax_amount', 'shipping_cost',
+            'final_amount', 'currency', 'payment_method', 'shipping_address',
+            'billing_address', 'notes', 'created_at'
+        ]
+        column_types = [
+            'uuid', 'uuid', 'text', 'text',
+            'numeric', 'numeric', 'numeric', 'numeric',
+            'numeric', 'text', 'text', 'jsonb',
+            'jsonb', 'text', 'timestamp'
+        ]
         
-        self.execute_batch_insert(query, orders_data, "Inserting orders")
+        self.parallel_copy_insert('orders', columns, build_order_rows, shard_args, count,
+                                  "Inserting orders", column_types,
+                                  user_ids=self.generated_data['user_ids'])
         print(f"✅ Generated {count:,} orders")
 
     def generate_performance_test_data(self):
@@ -371,57 +596,60 @@ class DatabaseDataGenerator:
         notification_types = ["order_update", "promotion", "newsletter", "security", "system"]
         priorities = ["low", "normal", "high", "urgent"]
         
-        notifications_data = []
+        pools = get_faker_pools()
         
-        for i in range(count):
-            notifications_data.append((
-                str(uuid.uuid4()),
+        notifications_data = (
+            (
+                notification_id,
                 random.choice(self.generated_data['user_ids']),
-                self.fake.sentence(nb_words=6),
-                self.fake.text(max_nb_chars=200),
+                random.choice(pools['sentence']),
+                random.choice(pools['text_200']),
                 random.choice(notification_types),
                 random.choice([True, False]),  # is_read
                 random.choice(priorities),
-                self.fake.url() if random.random() < 0.3 else None,
-                {"campaign_id": i} if random.random() < 0.2 else None,
-                self.fake.date_time_between(start_date='-6m', end_date='now')
-            ))
-        
-        query = """
-            INSERT INTO notifications (notification_id, user_id, title, message, notification_type,
-                                     is_read, priority, action_url, metadata, created_at)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """
+                random.choice(pools['url']) if random.random() < 0.3 else None,
+                f'{{"campaign_id": {i}}}' if random.random() < 0.2 else None,
+                random_past_datetime(SIX_MONTHS)
+            )
+            for i, notification_id in enumerate(uuid4_bulk(count))
+        )
+        
+        columns = [
+            'notification_id', 'user_id', 'title', 'message',
+            'notification_type', 'is_read', 'priority', 'action_url', 'metadata',
+            'created_at'
+        ]
         
-        self.execute_batch_insert(query, notifications_data, "Inserting notifications")
+        self.copy_insert('notifications', columns, notifications_data, count,
+                         "Inserting notifications")
         print(f"✅ Generated {count:,} notifications")
 
     def generate_favorites(self, count: int):
         """Generate user favorites records"""
         print(f"\n❤️ Generating {count:,} favorites...")
         
-        favorites_data = []
-        user_product_pairs = set()
-        
-        while len(favorites_data) < count:
-            user_id = random.choice(self.generated_data['user_ids'])
-            product_id = random.choice(self.generated_data['product_ids'])
-            
-            if (user_id, product_id) not in user_product_pairs:
-                user_product_pairs.add((user_id, product_id))
-                favorites_data.append((
-                    str(uuid.uuid4()),
-                    user_id,
-                    product_id,
-                    self.fake.date_time_between(start_date='-1y', end_date='now')
-                ))
-        
-        query = """
-            INSERT INTO favorites (favorite_id, user_id, product_id, added_at)
-            VALUES (%s, %s, %s, %s)
-        """
+        user_ids = self.generated_data['user_ids']
+        product_ids = self.generated_data['product_ids']
+        favorite_ids = uuid4_bulk(count)
+        
+        # Sample distinct cells of the user x product grid, no pair set needed
+        pair_indexes = random.sample(range(len(user_ids) * len(product_ids)), count)
+        
+        favorites_data = (
+            (
+                favorite_id,
+                user_ids[pair_index // len(product_ids)],
+                product_ids[pair_index % len(product_ids)],
+                random_past_datetime(ONE_YEAR)
+            )
+            for favorite_id, pair_index in zip(favorite_ids, pair_indexes)
+        )
+        
+        columns = [
+            'favorite_id', 'user_id', 'product_id', 'added_at'
+        ]
         
-        self.execute_batch_insert(query, favorites_data, "Inserting favorites")
+        self.copy_insert('favorites', columns, favorites_data, count, "Inserting favorites")
         print(f"✅ Generated {count:,} favorites")
 
     def generate_payments(self, count: int):
@@ -431,31 +659,43 @@ class DatabaseDataGenerator:
         payment_methods = ["credit_card", "debit_card", "paypal", "stripe", "apple_pay", "google_pay"]
         statuses = ["pending", "completed", "failed", "refunded", "cancelled"]
         
-        payments_data = []
         orders_sample = random.sample(self.generated_data['order_ids'], 
                                     min(count, len(self.generated_data['order_ids'])))
         
-        for order_id in orders_sample:
-            payments_data.append((
-                str(uuid.uuid4()),
+        # Draw the categorical columns for every payment up front
+        n = len(orders_sample)
+        payment_method_column = random.choices(payment_methods, k=n)
+        status_column = random.choices(statuses, k=n)
+        
+        payments_data = (
+            (
+                payment_id,
                 order_id,
-                random.choice(payment_methods),
-                random.choice(statuses),
+                payment_method,
+                status,
                 round(random.uniform(25.00, 2000.00), 2),
                 "USD",
                 f"TXN-{random.randint(10000000, 99999999)}",
-                {"gateway": "stripe", "fee": round(random.uniform(1.0, 10.0), 2)},
-                self.fake.date_time_between(start_date='-1y', end_date='now'),
-                self.fake.date_time_between(start_date='-1y', end_date='now')
-            ))
-        
-        query = """
-            INSERT INTO payments (payment_id, order_id, payment_method, payment_status, amount,
-                                currency, transaction_id, gateway_response, processed_at, created_at)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """
+                f'{{"gateway": "stripe", "fee": {round(random.uniform(1.0, 10.0), 2)}}}',
+                random_past_datetime(ONE_YEAR),
+                random_past_datetime(ONE_YEAR)
+            )
+            for payment_id, order_id, payment_method, status in zip(
+                uuid4_bulk(n), orders_sample, payment_method_column, status_column)
+        )
+        
+        columns = [
+            'payment_id', 'order_id', 'payment_method', 'payment_status',
+            'amount', 'currency', 'transaction_id', 'gateway_response',
+            'processed_at', 'created_at'
+        ]
+        column_types = [
+            'uuid', 'uuid', 'text', 'text',
+            'numeric', 'text', 'text', 'jsonb',
+            'timestamp', 'timestamp'
+        ]
         
-        self.execute_batch_insert(query, payments_data, "Inserting payments")
+        self.copy_insert('payments', columns, payments_data, n, "Inserting payments", column_types)
         print(f"✅ Generated {count:,} payments")
 
     def run_generation(self):
@@ -469,14 +709,28 @@ class DatabaseDataGenerator:
         try:
             self.connect_database()
             
-            # Generate data in dependency order
-            self.generate_users(1_000_000)
-            self.generate_categories(1_000)
-            self.generate_products(1_000_000)
-            self.generate_product_sizes(3_000_000)
-            self.generate_carts(800_000)
-            self.generate_orders(2_000_000)
-            self.generate_performance_test_data()
+            # Fewer checkpoints during the load; the server setting is put back afterwards
+            previous_wal_size = raise_max_wal_size(self.conn)
+            if previous_wal_size is None:
+                print("⚠️ Could not raise max_wal_size (needs superuser), keeping server default")
+            try:
+                # Load without per-row index maintenance and foreign key checks
+                saved_constraints = drop_load_constraints(self.conn, self.LOAD_TABLES)
+                try:
+                    # Generate data in dependency order
+                    self.generate_users(1_000_000)
+                    self.generate_categories(1_000)
+                    self.generate_products(1_000_000)
+                    self.generate_product_sizes(3_000_000)
+                    self.generate_carts(800_000)
+                    self.generate_orders(2_000_000)
+                    self.generate_performance_test_data()
+                finally:
+                    self.conn.rollback()
+                    rebuild_load_constraints(self.conn, saved_constraints)
+            finally:
+                if previous_wal_size is not None:
+                    restore_max_wal_size(self.conn, previous_wal_size)
             
             # Generate statistics
             self.print_statistics()
@@ -498,12 +752,7 @@ class DatabaseDataGenerator:
         
         try:
             # Get table record counts
-            tables = [
-                'users', 'categories', 'products', 'product_sizes', 
-                'cart', 'orders', 'notifications', 'favorites', 'payments'
-            ]
-            
-            for table in tables:
+            for table in self.LOAD_TABLES:
                 self.cursor.execute(f"SELECT COUNT(*) FROM {table}")
                 count = self.cursor.fetchone()[0]
                 print(f"   {table:20}: {count:>10,} records")
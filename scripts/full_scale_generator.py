@@ -14,11 +14,13 @@ from datetime import datetime, timedelta
 from typing import List, Dict, Any
 import json
 import psycopg2
-from psycopg2.extras import execute_batch
+from psycopg2.extras import execute_values
 from faker import Faker
 from tqdm import tqdm
 from dotenv import load_dotenv
 
+from pg_copy import apply_bulk_load_settings
+
 # Load environment variables
 load_dotenv()
 
@@ -29,8 +31,9 @@ class FullScaleDataGenerator:
         self.cursor = None
         
         # Configuration for FULL SCALE (1 million records)
-        self.BATCH_SIZE = 5000  # Larger batches for efficiency
+        self.BATCH_SIZE = 10_000  # Larger batches for efficiency
         self.TARGET_RECORDS_PER_TABLE = 1_000_000
+        self.COMMIT_EVERY_BATCHES = 50  # INSERT fallback commits this often
         
         # Connection parameters
         self.db_config = {
@@ -58,10 +61,7 @@ class FullScaleDataGenerator:
             self.cursor = self.conn.cursor()
             
             # Optimize for bulk inserts
-            self.cursor.execute("SET synchronous_commit = OFF;")
-            self.cursor.execute("SET checkpoint_segments = 32;")
-            self.cursor.execute("SET wal_buffers = 16MB;")
-            self.cursor.execute("SET shared_buffers = 256MB;")
+            apply_bulk_load_settings(self.cursor)
             
             print("✅ Connected to PostgreSQL database (Optimized for bulk inserts)")
             
@@ -78,15 +78,20 @@ class FullScaleDataGenerator:
         print("🔌 Database connection closed")
 
     def execute_batch_insert(self, query: str, data: List[tuple], description: str):
-        """Execute batch insert with progress tracking"""
+        """Execute batch insert with progress tracking (query must end in VALUES %s)"""
         try:
             with tqdm(total=len(data), desc=description, unit='records') as pbar:
-                for i in range(0, len(data), self.BATCH_SIZE):
+                for batch_number, i in enumerate(range(0, len(data), self.BATCH_SIZE), 1):
                     batch = data[i:i + self.BATCH_SIZE]
-                    execute_batch(self.cursor, query, batch, page_size=self.BATCH_SIZE)
-                    self.conn.commit()
+                    execute_values(self.cursor, query, batch, page_size=self.BATCH_SIZE)
                     pbar.update(len(batch))
                     
+                    # Checkpoint now and then so a crash doesn't lose a whole large table
+                    if batch_number % self.COMMIT_EVERY_BATCHES == 0:
+                        self.conn.commit()
+            
+            self.conn.commit()
+                    
         except Exception as e:
             print(f"❌ Error in batch insert for {description}: {e}")
             self.conn.rollback()
@@ -0,0 +1,307 @@
+"""
+PostgreSQL bulk-load helpers for the data generators
+Encodes Python rows in COPY text or binary format and streams them to the server
+"""
+
+import io
+import os
+import json
+import struct
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+import psycopg2
+from tqdm import tqdm
+
+# Maps a random hex digit to a valid RFC 4122 variant digit (8, 9, a or b)
+_UUID_VARIANT = '89ab' * 4
+
+# Session settings worth having on every bulk-load connection
+BULK_LOAD_SETTINGS = {
+    'synchronous_commit': 'off',      # don't wait for the WAL flush on commit
+    'work_mem': '256MB',
+    'maintenance_work_mem': '1GB',    # index rebuilds and FK validation
+    'temp_buffers': '256MB'
+}
+
+# Flush the COPY buffer once it holds roughly this many characters
+COPY_FLUSH_CHARS = 8 * 1024 * 1024
+
+# Characters that must be backslash-escaped inside a COPY text field
+_COPY_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r'})
+
+# Binary COPY framing: signature, flags and header extension length, then the end marker
+_BINARY_HEADER = b'PGCOPY\n\xff\r\n\x00' + struct.pack('!ii', 0, 0)
+_BINARY_TRAILER = struct.pack('!h', -1)
+_BINARY_NULL = struct.pack('!i', -1)
+
+# PostgreSQL's binary timestamps and dates count from 2000-01-01
+_PG_EPOCH = datetime(2000, 1, 1)
+_PG_EPOCH_DATE = _PG_EPOCH.date()
+_MICROSECOND = timedelta(microseconds=1)
+
+_TEXT_OID = 25
+
+
+def uuid4_bulk(count: int) -> List[str]:
+    """Return count random version 4 UUID strings from one os.urandom call"""
+    h = os.urandom(16 * count).hex()
+    return [
+        f"{h[j:j + 8]}-{h[j + 8:j + 12]}-4{h[j + 13:j + 16]}-"
+        f"{_UUID_VARIANT[int(h[j + 16], 16)]}{h[j + 17:j + 20]}-{h[j + 20:j + 32]}"
+        for j in range(0, 32 * count, 32)
+    ]
+
+
+def format_array(values: Sequence) -> str:
+    """Render a Python list as a PostgreSQL array literal"""
+    elements = []
+    for value in values:
+        if value is None:
+            elements.append('NULL')
+        else:
+            text = str(value).replace('\\', '\\\\').replace('"', '\\"')
+            elements.append(f'"{text}"')
+    return '{' + ','.join(elements) + '}'
+
+
+def format_copy_value(value) -> str:
+    """Render a single Python value as a COPY text field"""
+    if value is None:
+        return '\\N'
+    if value is True:
+        return 't'
+    if value is False:
+        return 'f'
+    if isinstance(value, str):
+        return value.translate(_COPY_ESCAPES)
+    if isinstance(value, dict):
+        return json.dumps(value).translate(_COPY_ESCAPES)
+    if isinstance(value, (list, tuple)):
+        return format_array(value).translate(_COPY_ESCAPES)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+def format_copy_row(row: Sequence) -> str:
+    """Render a row tuple as one tab-separated COPY line"""
+    return '\t'.join([format_copy_value(value) for value in row]) + '\n'
+
+
+def encode_numeric(value) -> bytes:
+    """Encode a number in PostgreSQL's binary numeric layout (base-10000 digits)"""
+    text = format(Decimal(repr(value)) if isinstance(value, float) else Decimal(value), 'f')
+    sign = 0x0000
+    if text.startswith('-'):
+        sign = 0x4000
+        text = text[1:]
+    integer, _, fraction = text.partition('.')
+    dscale = len(fraction)
+    
+    # Group the digits in fours outward from the decimal point
+    integer = integer.zfill(-(-len(integer) // 4) * 4)
+    fraction = fraction.ljust(-(-len(fraction) // 4) * 4, '0')
+    digits = [int(integer[i:i + 4]) for i in range(0, len(integer), 4)]
+    weight = len(digits) - 1
+    digits += [int(fraction[i:i + 4]) for i in range(0, len(fraction), 4)]
+    
+    while digits and digits[0] == 0:
+        digits.pop(0)
+        weight -= 1
+    while digits and digits[-1] == 0:
+        digits.pop()
+    if not digits:
+        weight = 0
+        sign = 0x0000
+    return struct.pack(f'!hhhh{len(digits)}h', len(digits), weight, sign, dscale, *digits)
+
+
+def encode_text_array(values: Sequence) -> bytes:
+    """Encode a one-dimensional text[] value in binary array layout"""
+    has_null = any(value is None for value in values)
+    parts = [struct.pack('!iiiii', 1, has_null, _TEXT_OID, len(values), 1)]
+    for value in values:
+        if value is None:
+            parts.append(_BINARY_NULL)
+        else:
+            data = str(value).encode()
+            parts.append(struct.pack('!i', len(data)) + data)
+    return b''.join(parts)
+
+
+# Binary encoders by column type; jsonb is a version byte followed by the JSON text
+BINARY_ENCODERS = {
+    'uuid': lambda value: bytes.fromhex(value.replace('-', '')),
+    'text': lambda value: value.encode(),
+    'jsonb': lambda value: b'\x01' + (value if isinstance(value, str) else json.dumps(value)).encode(),
+    'int4': lambda value: struct.pack('!i', value),
+    'bool': lambda value: b'\x01' if value else b'\x00',
+    'numeric': encode_numeric,
+    'timestamp': lambda value: struct.pack('!q', (value - _PG_EPOCH) // _MICROSECOND),
+    'date': lambda value: struct.pack('!i', (value - _PG_EPOCH_DATE).days),
+    'text[]': encode_text_array
+}
+
+
+def format_binary_row(row: Sequence, encoders: Sequence[Callable]) -> bytes:
+    """Render a row tuple as one binary COPY tuple"""
+    parts = [struct.pack('!h', len(row))]
+    for value, encode in zip(row, encoders):
+        if value is None:
+            parts.append(_BINARY_NULL)
+        else:
+            data = encode(value)
+            parts.append(struct.pack('!i', len(data)) + data)
+    return b''.join(parts)
+
+
+def copy_rows_text(cursor, table: str, columns: Sequence[str], lines: List[str]):
+    """Send already formatted COPY lines to a table"""
+    buffer = io.StringIO(''.join(lines))
+    cursor.copy_expert(
+        f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT text)",
+        buffer
+    )
+
+
+def copy_rows_binary(cursor, table: str, columns: Sequence[str], tuples: List[bytes]):
+    """Send already encoded binary COPY tuples to a table"""
+    buffer = io.BytesIO(_BINARY_HEADER + b''.join(tuples) + _BINARY_TRAILER)
+    cursor.copy_expert(
+        f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT binary)",
+        buffer
+    )
+
+
+def copy_stream(cursor, table: str, columns: Sequence[str], rows: Iterable[Sequence],
+                flush_chars: int = COPY_FLUSH_CHARS,
+                on_flush: Optional[Callable[[int], None]] = None,
+                column_types: Optional[Sequence[str]] = None) -> int:
+    """COPY rows from any iterable, holding at most about flush_chars of data at a time
+
+    With column_types (keys of BINARY_ENCODERS, one per column) rows go over binary COPY,
+    otherwise over text COPY. on_flush is called with the number of rows sent by each COPY;
+    returns the total row count.
+    """
+    if column_types:
+        encoders = [BINARY_ENCODERS[column_type] for column_type in column_types]
+        format_row = lambda row: format_binary_row(row, encoders)
+        send = copy_rows_binary
+    else:
+        format_row = format_copy_row
+        send = copy_rows_text
+    
+    lines = []
+    size = 0
+    total = 0
+    for row in rows:
+        line = format_row(row)
+        lines.append(line)
+        size += len(line)
+        if size >= flush_chars:
+            send(cursor, table, columns, lines)
+            total += len(lines)
+            if on_flush:
+                on_flush(len(lines))
+            lines = []
+            size = 0
+    if lines:
+        send(cursor, table, columns, lines)
+        total += len(lines)
+        if on_flush:
+            on_flush(len(lines))
+    return total
+
+
+def apply_bulk_load_settings(cursor):
+    """SET the BULK_LOAD_SETTINGS for the cursor's session"""
+    for name, value in BULK_LOAD_SETTINGS.items():
+        cursor.execute(f"SET {name} = %s", (value,))
+
+
+def raise_max_wal_size(conn, size: str = '8GB') -> Optional[str]:
+    """Raise max_wal_size server-wide so a long load doesn't checkpoint constantly
+
+    Commits any open transaction first; hand the result to restore_max_wal_size
+    once the load is done. Returns the value ALTER SYSTEM had set before ('' if
+    none), or None when the role is not allowed to change it (needs superuser).
+    """
+    conn.commit()
+    conn.autocommit = True  # ALTER SYSTEM can't run inside a transaction block
+    try:
+        with conn.cursor() as cursor:
+            # Only a value that came from postgresql.auto.conf needs putting back
+            cursor.execute("""
+                SELECT setting || coalesce(unit, ''), sourcefile
+                FROM pg_settings WHERE name = 'max_wal_size'
+            """)
+            setting, sourcefile = cursor.fetchone()
+            previous = setting if (sourcefile or '').endswith('postgresql.auto.conf') else ''
+            cursor.execute("ALTER SYSTEM SET max_wal_size = %s", (size,))
+            cursor.execute("SELECT pg_reload_conf()")
+        return previous
+    except psycopg2.Error:
+        return None
+    finally:
+        conn.autocommit = False
+
+
+def restore_max_wal_size(conn, previous: str):
+    """Undo raise_max_wal_size, given the value it returned; rolls back any open transaction"""
+    conn.rollback()
+    conn.autocommit = True
+    try:
+        with conn.cursor() as cursor:
+            if previous:
+                cursor.execute("ALTER SYSTEM SET max_wal_size = %s", (previous,))
+            else:
+                cursor.execute("ALTER SYSTEM RESET max_wal_size")
+            cursor.execute("SELECT pg_reload_conf()")
+    finally:
+        conn.autocommit = False
+
+
+def drop_load_constraints(conn, tables: List[str]) -> Dict[str, List[tuple]]:
+    """Drop foreign keys and secondary indexes on tables, returning their definitions"""
+    with conn.cursor() as cursor:
+        cursor.execute("""
+            SELECT conrelid::regclass::text, conname, pg_get_constraintdef(oid)
+            FROM pg_constraint
+            WHERE contype = 'f' AND conrelid = ANY(%s::regclass[])
+        """, (tables,))
+        foreign_keys = cursor.fetchall()
+        
+        # Primary keys and unique indexes stay, the generated ids and emails rely on them
+        cursor.execute("""
+            SELECT indexrelid::regclass::text, pg_get_indexdef(indexrelid)
+            FROM pg_index
+            WHERE indrelid = ANY(%s::regclass[]) AND NOT indisprimary AND NOT indisunique
+        """, (tables,))
+        indexes = cursor.fetchall()
+        
+        for table, name, _ in foreign_keys:
+            cursor.execute(f'ALTER TABLE {table} DROP CONSTRAINT "{name}"')
+        for name, _ in indexes:
+            cursor.execute(f"DROP INDEX {name}")
+    conn.commit()
+    
+    print(f"🔓 Dropped {len(foreign_keys)} foreign keys and {len(indexes)} indexes for the load")
+    return {'foreign_keys': foreign_keys, 'indexes': indexes}
+
+
+def rebuild_load_constraints(conn, saved: Dict[str, List[tuple]]):
+    """Recreate the indexes and foreign keys removed by drop_load_constraints"""
+    print("\n🔒 Rebuilding indexes and foreign keys...")
+    with conn.cursor() as cursor:
+        for _, definition in tqdm(saved['indexes'], desc="Rebuilding indexes", unit='indexes'):
+            cursor.execute(definition)
+        
+        # NOT VALID skips the check on add; VALIDATE then scans each table once
+        for table, name, definition in saved['foreign_keys']:
+            cursor.execute(f'ALTER TABLE {table} ADD CONSTRAINT "{name}" {definition} NOT VALID')
+        conn.commit()
+        
+        for table, name, _ in tqdm(saved['foreign_keys'], desc="Validating foreign keys", unit='constraints'):
+            cursor.execute(f'ALTER TABLE {table} VALIDATE CONSTRAINT "{name}"')
+            conn.commit()
@@ -8,9 +8,10 @@ import os
 import sys
 import time
 import random
-import uuid
+import multiprocessing
 from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import json
 import psycopg2
 from psycopg2.extras import execute_batch
@@ -18,18 +19,104 @@ from faker import Faker
 from tqdm import tqdm
 from dotenv import load_dotenv
 
+from pg_copy import (copy_stream, uuid4_bulk, apply_bulk_load_settings, drop_load_constraints,
+                     rebuild_load_constraints)
+
 # Load environment variables
 load_dotenv()
 
+# Progress bars redraw at most twice a second, and stay off when output isn't a terminal
+TQDM_OPTIONS = {
+    'unit': 'records',
+    'mininterval': 0.5,
+    'miniters': 1000,
+    'smoothing': 0.1,
+    'disable': not sys.stdout.isatty()
+}
+
+# Spans for random timestamps, in seconds
+ONE_YEAR = 365 * 24 * 3600
+TWO_YEARS = 2 * ONE_YEAR
+
+def random_past_datetime(seconds_back: int) -> datetime:
+    """Return a random datetime within the last seconds_back seconds"""
+    return datetime.fromtimestamp(time.time() - random.random() * seconds_back)
+
+# How many values to pre-generate per Faker method; rows pick from these pools
+FAKER_POOL_SIZES = {
+    'first_name': 2000,
+    'last_name': 2000,
+    'phone_number': 2000,
+    'street_address': 2000,
+    'city': 2000,
+    'state': 500,
+    'zipcode': 2000,
+    'country': 500,
+    'image_url': 500,
+    'catch_phrase': 2000,
+    'bs': 1000
+}
+
+# Column limits applied once to the pooled values, so rows need no slicing
+POOL_MAX_LENGTHS = {
+    'first_name': 49,
+    'last_name': 49,
+    'phone_number': 19,
+    'image_url': 254,
+    'catch_phrase': 199,
+    'bs': 99
+}
+
+# Filler text pools: pool name -> (max_nb_chars, size)
+TEXT_POOL_SIZES = {
+    'text_100': (100, 1000),
+    'text_200': (200, 1000),
+    'text_500': (500, 1000)
+}
+
+# How many pre-serialized JSON addresses to keep for orders
+ADDRESS_POOL_SIZE = 2000
+
+# Faker value pools, built on first use and inherited by forked workers
+_faker_pools = None
+
+def get_faker_pools(fake: Faker) -> Dict[str, List[str]]:
+    """Return the pools of pre-generated Faker values, building them with fake if needed"""
+    global _faker_pools
+    if _faker_pools is None:
+        _faker_pools = {
+            method: [getattr(fake, method)() for _ in range(size)]
+            for method, size in FAKER_POOL_SIZES.items()
+        }
+        for method, max_length in POOL_MAX_LENGTHS.items():
+            _faker_pools[method] = [value[:max_length] for value in _faker_pools[method]]
+        for name, (max_nb_chars, size) in TEXT_POOL_SIZES.items():
+            _faker_pools[name] = [fake.text(max_nb_chars=max_nb_chars) for _ in range(size)]
+        # Order addresses are stored already JSON-encoded, rows paste them as-is
+        _faker_pools['address_json'] = [
+            json.dumps({
+                "street": random.choice(_faker_pools['street_address']),
+                "city": random.choice(_faker_pools['city']),
+                "state": random.choice(_faker_pools['state']),
+                "zip": random.choice(_faker_pools['zipcode']),
+                "country": random.choice(_faker_pools['country'])
+            })
+            for _ in range(ADDRESS_POOL_SIZE)
+        ]
+    return _faker_pools
+
 class QuickDataGenerator:
     def __init__(self):
-        self.fake = Faker()
+        # Unweighted Faker skips the cumulative-weight sampling step on every call
+        self.fake = Faker(use_weighting=False)
         self.conn = None
         self.cursor = None
         
         # Configuration for quick testing
         self.BATCH_SIZE = 1000
         self.TARGET_RECORDS_PER_TABLE = 10_000  # Much smaller for testing
+        self.LOAD_TABLES = ['users', 'categories', 'products', 'orders', 'payments']
+        self.SEED = 42  # Fixed seed so repeated runs generate the same rows (ids aside)
         
         # Connection parameters
         self.db_config = {
@@ -57,6 +144,9 @@ class QuickDataGenerator:
             self.cursor = self.conn.cursor()
             print("✅ Connected to PostgreSQL database")
             
+            # Optimize for bulk inserts (synchronous_commit off and friends)
+            apply_bulk_load_settings(self.cursor)
+            
             # Test connection
             self.cursor.execute("SELECT version();")
             version = self.cursor.fetchone()
@@ -75,211 +165,265 @@ class QuickDataGenerator:
         print("🔌 Database connection closed")
 
     def execute_batch_insert(self, query: str, data: List[tuple], description: str):
-        """Execute batch insert with progress tracking"""
+        """Execute batch insert with progress tracking (INSERT fallback to copy_insert)"""
         try:
-            with tqdm(total=len(data), desc=description, unit='records') as pbar:
+            with tqdm(total=len(data), desc=description, **TQDM_OPTIONS) as pbar:
                 for i in range(0, len(data), self.BATCH_SIZE):
                     batch = data[i:i + self.BATCH_SIZE]
                     execute_batch(self.cursor, query, batch, page_size=self.BATCH_SIZE)
-                    self.conn.commit()
                     pbar.update(len(batch))
+            
+            # One commit per table
+            self.conn.commit()
                     
         except Exception as e:
             print(f"❌ Error in batch insert for {description}: {e}")
             self.conn.rollback()
             raise
 
-    def generate_users(self, count: int = 10_000):
-        """Generate user records"""
-        print(f"\n🧑‍💼 Generating {count:,} users...")
-        
-        users_data = []
+    def copy_insert(self, table: str, columns: List[str], rows: Iterator[tuple], total: int,
+                    description: str, column_types: List[str] = None) -> int:
+        """Stream rows from an iterator into a table through COPY with progress tracking
+
+        Passing column_types switches the table to binary COPY.
+        """
+        try:
+            with tqdm(total=total, desc=description, **TQDM_OPTIONS) as pbar:
+                count = copy_stream(self.cursor, table, columns, rows, on_flush=pbar.update,
+                                    column_types=column_types)
+            
+            # One commit per table
+            self.conn.commit()
+            return count
+                    
+        except Exception as e:
+            print(f"❌ Error in COPY for {description}: {e}")
+            self.conn.rollback()
+            raise
+
+    def iter_users(self, count: int) -> Iterator[tuple]:
+        """Yield user rows; all user ids are recorded up front"""
         roles = ['customer'] * 9500 + ['staff'] * 450 + ['admin'] * 50  # 95% customers, 4.5% staff, 0.5% admin
         random.shuffle(roles)
-        
-        for i in range(count):
-            user_id = str(uuid.uuid4())
-            self.generated_data['user_ids'].append(user_id)
-            
-            first_name = self.fake.first_name()
-            last_name = self.fake.last_name()
+        pools = get_faker_pools(self.fake)
+        user_ids = uuid4_bulk(count)
+        self.generated_data['user_ids'].extend(user_ids)
+        
+        # Bind the per-row lookups to locals once, outside the loop
+        choice = random.choice
+        first_names = pools['first_name']
+        last_names = pools['last_name']
+        phone_numbers = pools['phone_number']
+        date_of_birth = self.fake.date_of_birth
+        role_count = len(roles)
+        
+        for i, user_id in enumerate(user_ids):
+            first_name = choice(first_names)
+            last_name = choice(last_names)
             username = f"{first_name.lower()}.{last_name.lower()}.{i}"[:49]  # Limit to 49 chars
-            email = f"{username}@example.com"[:99]  # Limit to 99 chars
-            phone = self.fake.phone_number()[:19]  # Limit to 19 chars
+            email = f"{username}@example.com"  # At most 61 chars
+            phone = choice(phone_numbers)
             
-            users_data.append((
+            yield (
                 user_id,
                 username,
                 email,
                 '$2b$10$rKjw.6QxEQsxZ5GvKjQxHOqXcXPKXP8Zd8WcE7Y3qYzRxZqK9WqDC',  # hashed 'password123'
-                first_name[:49],  # Limit first name
-                last_name[:49],   # Limit last name
+                first_name,
+                last_name,
                 phone,
-                self.fake.date_of_birth(minimum_age=18, maximum_age=80),
-                self.fake.date_time_between(start_date='-2y', end_date='now'),
-                roles[i % len(roles)]
-            ))
+                date_of_birth(minimum_age=18, maximum_age=80),
+                random_past_datetime(TWO_YEARS),
+                roles[i % role_count]
+            )
+
+    def generate_users(self, count: int = 10_000):
+        """Generate user records"""
+        print(f"\n🧑‍💼 Generating {count:,} users...")
         
-        query = """
-            INSERT INTO users (user_id, username, email, password_hash, first_name, last_name, 
-                             phone, date_of_birth, created_at, role)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """
+        columns = [
+            'user_id', 'username', 'email', 'password_hash', 'first_name',
+            'last_name', 'phone', 'date_of_birth', 'created_at', 'role'
+        ]
         
-        self.execute_batch_insert(query, users_data, "Inserting users")
+        self.copy_insert('users', columns, self.iter_users(count), count, "Inserting users")
         print(f"✅ Generated {count:,} users")
 
-    def generate_categories(self, count: int = 500):
-        """Generate category records"""
-        print(f"\n📂 Generating {count:,} categories...")
-        
+    def iter_categories(self, count: int) -> Iterator[tuple]:
+        """Yield root then sub-category rows; all category ids are recorded up front"""
         base_categories = [
             "Electronics", "Clothing", "Books", "Home & Garden", "Sports", "Beauty",
             "Automotive", "Toys", "Health", "Food", "Jewelry", "Music", "Pet Supplies",
             "Office", "Industrial", "Travel", "Baby", "Outdoor", "Art", "Collectibles"
         ]
         
-        categories_data = []
-        parent_category_ids = []
+        pools = get_faker_pools(self.fake)
+        category_ids = uuid4_bulk(max(count, len(base_categories)))  # roots are always created
+        self.generated_data['category_ids'].extend(category_ids)
+        parent_category_ids = category_ids[:len(base_categories)]
         
-        for name in base_categories:
-            category_id = str(uuid.uuid4())
-            self.generated_data['category_ids'].append(category_id)
-            parent_category_ids.append(category_id)
-            
-            categories_data.append((
+        for name, category_id in zip(base_categories, parent_category_ids):
+            yield (
                 category_id,
                 name,
-                self.fake.text(max_nb_chars=200),
+                random.choice(pools['text_200']),
                 None,
-                self.fake.image_url(),
+                random.choice(pools['image_url']),
                 True,
-                self.fake.date_time_between(start_date='-1y', end_date='now')
-            ))
-        
-        for i in range(count - len(base_categories)):
-            category_id = str(uuid.uuid4())
-            self.generated_data['category_ids'].append(category_id)
-            
-            categories_data.append((
+                random_past_datetime(ONE_YEAR)
+            )
+        
+        choice = random.choice
+        rand = random.random
+        bs = pools['bs']
+        descriptions = pools['text_200']
+        image_urls = pools['image_url']
+        active_flags = [True, True, True, False]
+        
+        for category_id in category_ids[len(base_categories):]:
+            yield (
                 category_id,
-                self.fake.bs().title()[:99],  # Limit category name
-                self.fake.text(max_nb_chars=200),
-                random.choice(parent_category_ids) if random.random() < 0.7 else None,
-                self.fake.image_url()[:254],  # Limit URL
-                random.choice([True, True, True, False]),
-                self.fake.date_time_between(start_date='-1y', end_date='now')
-            ))
+                choice(bs).title(),
+                choice(descriptions),
+                choice(parent_category_ids) if rand() < 0.7 else None,
+                choice(image_urls),
+                choice(active_flags),
+                random_past_datetime(ONE_YEAR)
+            )
+
+    def generate_categories(self, count: int = 500):
+        """Generate category records"""
+        print(f"\n📂 Generating {count:,} categories...")
         
-        query = """
-            INSERT INTO categories (category_id, name, description, parent_category_id, 
-                                  image_url, is_active, created_at)
-            VALUES (%s, %s, %s, %s, %s, %s, %s)
-        """
+        columns = [
+            'category_id', 'name', 'description', 'parent_category_id',
+            'image_url', 'is_active', 'created_at'
+        ]
         
-        self.execute_batch_insert(query, categories_data, "Inserting categories")
+        self.copy_insert('categories', columns, self.iter_categories(count), count,
+                         "Inserting categories")
         print(f"✅ Generated {count:,} categories")
 
-    def generate_products(self, count: int = 10_000):
-        """Generate product records"""
-        print(f"\n🛍️ Generating {count:,} products...")
-        
-        brands = ["Apple", "Samsung", "Nike", "Adidas", "Sony"] + [self.fake.company() for _ in range(20)]
+    def iter_products(self, count: int) -> Iterator[tuple]:
+        """Yield product rows; all product ids are recorded up front"""
+        brands = ["Apple", "Samsung", "Nike", "Adidas", "Sony"] + [self.fake.company()[:99] for _ in range(20)]
         materials = ["Cotton", "Polyester", "Plastic", "Metal", "Wood", "Glass"]
         colors = ["Red", "Blue", "Green", "Black", "White", "Gray"]
-        
-        products_data = []
-        
-        for i in range(count):
-            product_id = str(uuid.uuid4())
-            self.generated_data['product_ids'].append(product_id)
-            
-            products_data.append((
+        pools = get_faker_pools(self.fake)
+        product_ids = uuid4_bulk(count)
+        self.generated_data['product_ids'].extend(product_ids)
+        
+        choice = random.choice
+        choices = random.choices
+        uniform = random.uniform
+        randint = random.randint
+        names = pools['catch_phrase']
+        descriptions = pools['text_500']
+        image_urls = pools['image_url']
+        category_ids = self.generated_data['category_ids']
+        active_flags = [True, True, True, False]
+        
+        for i, product_id in enumerate(product_ids):
+            yield (
                 product_id,
-                self.fake.catch_phrase()[:199],  # Limit product name
-                self.fake.text(max_nb_chars=500),
-                random.choice(self.generated_data['category_ids']),
-                random.choice(brands)[:99],  # Limit brand name
+                choice(names),
+                choice(descriptions),
+                choice(category_ids),
+                choice(brands),
                 f"SKU-{i:08d}",
-                round(random.uniform(9.99, 999.99), 2),
-                round(random.uniform(0, 50), 2),
-                random.randint(0, 1000),
-                round(random.uniform(0.1, 50.0), 2),
-                f"{random.randint(10, 100)}x{random.randint(10, 100)}x{random.randint(5, 50)}cm"[:49],  # Limit dimensions
-                random.choice(colors),
-                random.choice(materials),
-                [self.fake.image_url() for _ in range(random.randint(1, 3))],
-                random.choice([True, True, True, False]),
-                self.fake.date_time_between(start_date='-1y', end_date='now')
-            ))
+                round(uniform(9.99, 999.99), 2),
+                round(uniform(0, 50), 2),
+                randint(0, 1000),
+                round(uniform(0.1, 50.0), 2),
+                f"{randint(10, 100)}x{randint(10, 100)}x{randint(5, 50)}cm",
+                choice(colors),
+                choice(materials),
+                choices(image_urls, k=randint(1, 3)),
+                choice(active_flags),
+                random_past_datetime(ONE_YEAR)
+            )
+
+    def generate_products(self, count: int = 10_000):
+        """Generate product records"""
+        print(f"\n🛍️ Generating {count:,} products...")
         
-        query = """
-            INSERT INTO products (product_id, name, description, category_id, brand, sku, 
-                                base_price, discount_percentage, stock_quantity, weight, 
-                                dimensions, color, material, image_urls, is_active, created_at)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """
+        columns = [
+            'product_id', 'name', 'description', 'category_id', 'brand', 'sku',
+            'base_price', 'discount_percentage', 'stock_quantity', 'weight',
+            'dimensions', 'color', 'material', 'image_urls', 'is_active',
+            'created_at'
+        ]
+        # Numeric-heavy table: binary COPY spares the server parsing every price
+        column_types = [
+            'uuid', 'text', 'text', 'uuid', 'text', 'text',
+            'numeric', 'numeric', 'int4', 'numeric',
+            'text', 'text', 'text', 'text[]', 'bool',
+            'timestamp'
+        ]
         
-        self.execute_batch_insert(query, products_data, "Inserting products")
+        self.copy_insert('products', columns, self.iter_products(count), count,
+                         "Inserting products", column_types)
         print(f"✅ Generated {count:,} products")
 
-    def generate_orders(self, count: int = 10_000):
-        """Generate order records"""
-        print(f"\n📦 Generating {count:,} orders...")
-        
+    def iter_orders(self, count: int) -> Iterator[tuple]:
+        """Yield order rows; all order ids are recorded up front"""
         statuses = ["pending", "confirmed", "processing", "shipped", "delivered", "cancelled"]
         payment_methods = ["credit_card", "debit_card", "paypal", "stripe"]
-        
-        orders_data = []
-        
-        for i in range(count):
-            order_id = str(uuid.uuid4())
-            self.generated_data['order_ids'].append(order_id)
-            
-            total_amount = round(random.uniform(25.00, 2000.00), 2)
-            discount_amount = round(total_amount * random.uniform(0, 0.3), 2)
+        pools = get_faker_pools(self.fake)
+        order_ids = uuid4_bulk(count)
+        self.generated_data['order_ids'].extend(order_ids)
+        
+        choice = random.choice
+        uniform = random.uniform
+        rand = random.random
+        user_ids = self.generated_data['user_ids']
+        addresses = pools['address_json']
+        notes = pools['text_100']
+        
+        for i, order_id in enumerate(order_ids):
+            total_amount = round(uniform(25.00, 2000.00), 2)
+            discount_amount = round(total_amount * uniform(0, 0.3), 2)
             tax_amount = round(total_amount * 0.08, 2)
-            shipping_cost = round(random.uniform(5.99, 29.99), 2)
+            shipping_cost = round(uniform(5.99, 29.99), 2)
             final_amount = round(total_amount - discount_amount + tax_amount + shipping_cost, 2)
             
-            orders_data.append((
+            yield (
                 order_id,
-                random.choice(self.generated_data['user_ids']),
+                choice(user_ids),
                 f"ORD-{i:08d}",
-                random.choice(statuses),
+                choice(statuses),
                 total_amount,
                 discount_amount,
                 tax_amount,
                 shipping_cost,
                 final_amount,
                 "USD",
-                random.choice(payment_methods),
-                json.dumps({
-                    "street": self.fake.street_address(),
-                    "city": self.fake.city(),
-                    "state": self.fake.state(),
-                    "zip": self.fake.zipcode(),
-                    "country": self.fake.country()
-                }),
-                json.dumps({
-                    "street": self.fake.street_address(),
-                    "city": self.fake.city(),
-                    "state": self.fake.state(),
-                    "zip": self.fake.zipcode(),
-                    "country": self.fake.country()
-                }),
-                self.fake.text(max_nb_chars=100) if random.random() < 0.3 else None,
-                self.fake.date_time_between(start_date='-1y', end_date='now')
-            ))
+                choice(payment_methods),
+                choice(addresses),  # shipping_address
+                choice(addresses),  # billing_address
+                choice(notes) if rand() < 0.3 else None,
+                random_past_datetime(ONE_YEAR)
+            )
+
+    def generate_orders(self, count: int = 10_000):
+        """Generate order records"""
+        print(f"\n📦 Generating {count:,} orders...")
         
-        query = """
-            INSERT INTO orders (order_id, user_id, order_number, order_status, total_amount,
-                              discount_amount, tax_amount, shipping_cost, final_amount, currency,
-                              payment_method, shipping_address, billing_address, notes, created_at)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """
+        columns = [
+            'order_id', 'user_id', 'order_number', 'order_status',
+            'total_amount', 'discount_amount', 'tax_amount', 'shipping_cost',
+            'final_amount', 'currency', 'payment_method', 'shipping_address',
+            'billing_address', 'notes', 'created_at'
+        ]
+        column_types = [
+            'uuid', 'uuid', 'text', 'text',
+            'numeric', 'numeric', 'numeric', 'numeric',
+            'numeric', 'text', 'text', 'jsonb',
+            'jsonb', 'text', 'timestamp'
+        ]
         
-        self.execute_batch_insert(query, orders_data, "Inserting orders")
+        self.copy_insert('orders', columns, self.iter_orders(count), count, "Inserting orders",
+                         column_types)
         print(f"✅ Generated {count:,} orders")
 
     def generate_payments(self, count: int = 10_000):
@@ -289,31 +433,45 @@ class QuickDataGenerator:
         payment_methods = ["credit_card", "debit_card", "paypal", "stripe"]
         statuses = ["completed", "pending", "failed", "refunded"]
         
-        payments_data = []
-        orders_sample = random.sample(self.generated_data['order_ids'], 
-                                    min(count, len(self.generated_data['order_ids'])))
-        
-        for order_id in orders_sample:
-            payments_data.append((
-                str(uuid.uuid4()),
+        order_ids = self.generated_data['order_ids']
+        # Every order gets a payment in the normal run, so only sample when asked for fewer
+        if count >= len(order_ids):
+            orders_sample = order_ids
+        else:
+            orders_sample = random.sample(order_ids, count)
+        
+        choice = random.choice
+        uniform = random.uniform
+        randint = random.randint
+        payments_data = (
+            (
+                payment_id,
                 order_id,
-                random.choice(payment_methods),
-                random.choice(statuses),
-                round(random.uniform(25.00, 2000.00), 2),
+                choice(payment_methods),
+                choice(statuses),
+                round(uniform(25.00, 2000.00), 2),
                 "USD",
-                f"TXN-{random.randint(10000000, 99999999)}",
-                json.dumps({"gateway": "stripe", "fee": round(random.uniform(1.0, 10.0), 2)}),
-                self.fake.date_time_between(start_date='-1y', end_date='now'),
-                self.fake.date_time_between(start_date='-1y', end_date='now')
-            ))
-        
-        query = """
-            INSERT INTO payments (payment_id, order_id, payment_method, payment_status, amount,
-                                currency, transaction_id, gateway_response, processed_at, created_at)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """
+                f"TXN-{randint(10000000, 99999999)}",
+                f'{{"gateway": "stripe", "fee": {round(uniform(1.0, 10.0), 2)}}}',
+                random_past_datetime(ONE_YEAR),
+                random_past_datetime(ONE_YEAR)
+            )
+            for payment_id, order_id in zip(uuid4_bulk(len(orders_sample)), orders_sample)
+        )
+        
+        columns = [
+            'payment_id', 'order_id', 'payment_method', 'payment_status',
+            'amount', 'currency', 'transaction_id', 'gateway_response',
+            'processed_at', 'created_at'
+        ]
+        column_types = [
+            'uuid', 'uuid', 'text', 'text',
+            'numeric', 'text', 'text', 'jsonb',
+            'timestamp', 'timestamp'
+        ]
         
-        self.execute_batch_insert(query, payments_data, "Inserting payments")
+        self.copy_insert('payments', columns, payments_data, len(orders_sample),
+                         "Inserting payments", column_types)
         print(f"✅ Generated {count:,} payments")
 
     def run_generation(self):
@@ -323,6 +481,9 @@ class QuickDataGenerator:
         print("🚀 Starting Quick Data Generation (10K records per table)")
         print(f"🔧 Batch size: {self.BATCH_SIZE:,}")
         
+        random.seed(self.SEED)
+        self.fake.seed_instance(self.SEED)
+        
         try:
             self.connect_database()
             
@@ -331,20 +492,29 @@ class QuickDataGenerator:
             tables = ['payments', 'orders', 'cart_items', 'cart', 'product_sizes', 
                      'favorites', 'notifications', 'products', 'categories', 'users']
             
-            for table in tables:
-                try:
-                    self.cursor.execute(f"DELETE FROM {table};")
-                    self.conn.commit()
-                    print(f"   ✅ Cleared {table}")
-                except Exception as e:
-                    print(f"   ⚠️ Could not clear {table}: {e}")
+            # One TRUNCATE instead of a DELETE per table; CASCADE also empties tables referencing these
+            try:
+                self.cursor.execute(f"TRUNCATE TABLE {', '.join(tables)} RESTART IDENTITY CASCADE;")
+                self.conn.commit()
+                print(f"   ✅ Cleared {', '.join(tables)}")
+            except Exception as e:
+                self.conn.rollback()
+                print(f"   ⚠️ Could not clear tables: {e}")
             
-            # Generate data
-            self.generate_users(10_000)
-            self.generate_categories(500)
-            self.generate_products(10_000)
-            self.generate_orders(10_000)
-            self.generate_payments(10_000)
+            # Load without per-row index maintenance and foreign key checks
+            saved_constraints = drop_load_constraints(self.conn, self.LOAD_TABLES)
+            try:
+                # Generate data
+                self.generate_users(10_000)
+                self.generate_categories(500)
+                self.run_parallel([
+                    ('generate_products', 10_000, 'product_ids'),
+                    ('generate_orders', 10_000, 'order_ids')
+                ])
+                self.generate_payments(10_000)
+            finally:
+                self.conn.rollback()
+                rebuild_load_constraints(self.conn, saved_constraints)
             
             # Print statistics
             self.print_statistics()
@@ -360,14 +530,28 @@ class QuickDataGenerator:
         print(f"\n✅ Data generation completed in {duration:.2f} seconds")
         print(f"📈 Generated approximately {50_000:,} total records")
 
+    def run_parallel(self, jobs: List[tuple]):
+        """Run independent (method, count, ids_key) generate jobs in worker processes"""
+        # Products and orders only need the user and category ids, so they load side by side;
+        # jobs carry everything they need, so spawned workers (no fork on Windows) work too
+        start_method = 'fork' if 'fork' in multiprocessing.get_all_start_methods() else None
+        with ProcessPoolExecutor(max_workers=len(jobs),
+                                 mp_context=multiprocessing.get_context(start_method)) as executor:
+            # Seeds come from the parent's seeded stream, so each job is reproducible too
+            futures = {
+                executor.submit(run_in_worker, method, count, self.generated_data, ids_key,
+                                random.getrandbits(64)): ids_key
+                for method, count, ids_key in jobs
+            }
+            for future in as_completed(futures):
+                self.generated_data[futures[future]] = future.result()
+
     def print_statistics(self):
         """Print generation statistics"""
         print("\n📊 Generation Statistics:")
         
         try:
-            tables = ['users', 'categories', 'products', 'orders', 'payments']
-            
-            for table in tables:
+            for table in self.LOAD_TABLES:
                 self.cursor.execute(f"SELECT COUNT(*) FROM {table}")
                 count = self.cursor.fetchone()[0]
                 print(f"   {table:20}: {count:>10,} records")
@@ -375,6 +559,20 @@ class QuickDataGenerator:
         except Exception as e:
             print(f"❌ Error getting statistics: {e}")
 
+def run_in_worker(method: str, count: int, generated_data: Dict[str, List[str]],
+                  ids_key: str, seed: int) -> List[str]:
+    """Run one generate_* method on a fresh generator and connection, returning its new ids"""
+    generator = QuickDataGenerator()
+    random.seed(seed)
+    generator.fake.seed_instance(seed)
+    generator.generated_data = generated_data
+    generator.connect_database()
+    try:
+        getattr(generator, method)(count)
+    finally:
+        generator.close_connection()
+    return generator.generated_data[ids_key]
+
 if __name__ == "__main__":
     generator = QuickDataGenerator()
     generator.run_generation()
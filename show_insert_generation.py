@@ -4,6 +4,7 @@ Demonstrate how user data becomes INSERT statements in backups
 """
 
 import psycopg2
+from psycopg2 import sql
 import os
 from datetime import datetime
 
@@ -20,28 +21,54 @@ cursor = conn.cursor()
 
 print("🔍 Showing how web form data becomes INSERT statements in backups\n")
 
+# Everything the demo shows, fetched in one round-trip
+insert_columns = ['user_id', 'username', 'email', 'password_hash', 'first_name', 'last_name', 'role', 'created_at']
+cursor.execute(sql.SQL("""
+    WITH sample AS (
+        SELECT {columns} FROM users LIMIT 5
+    ), recent AS (
+        SELECT username, email, created_at
+        FROM users
+        WHERE created_at >= NOW() - INTERVAL '7 days'
+        ORDER BY created_at DESC
+        LIMIT 5
+    )
+    SELECT
+        (SELECT COUNT(*) FROM users),
+        (SELECT json_agg(sample) FROM sample),
+        (SELECT json_agg(recent) FROM recent)
+""").format(columns=sql.SQL(', ').join(map(sql.Identifier, insert_columns))))
+total_users, users, recent_users = cursor.fetchone()
+users = users or []
+recent_users = recent_users or []
+
+# Render the demo INSERTs with proper quoting while the connection is still open
+insert_query = sql.SQL("INSERT INTO {table} ({columns}) VALUES ({values});").format(
+    table=sql.Identifier('users'),
+    columns=sql.SQL(', ').join(map(sql.Identifier, insert_columns)),
+    values=sql.SQL(', ').join(sql.Placeholder() * len(insert_columns))
+)
+insert_statements = [
+    cursor.mogrify(insert_query, [user[column] for column in insert_columns]).decode()
+    for user in users[:3]
+]
+
+cursor.close()
+conn.close()
+
 # 1. Show current users (these came from web forms/API calls, not manual SQL)
 print("📊 Current users in database (from web forms/API):")
-cursor.execute("SELECT id, username, email, created_at FROM users LIMIT 5")
-users = cursor.fetchall()
-
 for user in users:
-    print(f"   ID: {user[0]}, Username: {user[1]}, Email: {user[2]}")
+    print(f"   ID: {user['user_id']}, Username: {user['username']}, Email: {user['email']}")
 
 print(f"\n💾 Total users in database: ", end="")
-cursor.execute("SELECT COUNT(*) FROM users")
-total_users = cursor.fetchone()[0]
 print(f"{total_users}")
 
 # 2. Show what INSERT statements would look like for these users
 print(f"\n🔧 What pg_dump generates as INSERT statements for these users:")
 print("   (This is what appears in backup files)")
 
-cursor.execute("SELECT id, username, email, password_hash, full_name, role, created_at FROM users LIMIT 3")
-sample_users = cursor.fetchall()
-
-for user in sample_users:
-    insert_sql = f"""INSERT INTO users (id, username, email, password_hash, full_name, role, created_at) VALUES ({user[0]}, '{user[1]}', '{user[2]}', '{user[3]}', '{user[4]}', '{user[5]}', '{user[6]}');"""
+for insert_sql in insert_statements:
     print(f"   {insert_sql}")
 
 # 3. Show data flow
@@ -56,24 +83,12 @@ print("   7. During restore, these INSERT statements recreate the data")
 
 # 4. Show recent activity
 print(f"\n📈 Recent user registrations (from web forms):")
-cursor.execute("""
-    SELECT username, email, created_at 
-    FROM users 
-    WHERE created_at >= NOW() - INTERVAL '7 days' 
-    ORDER BY created_at DESC 
-    LIMIT 5
-""")
-recent_users = cursor.fetchall()
-
 if recent_users:
     for user in recent_users:
-        print(f"   {user[0]} ({user[1]}) - {user[2]}")
+        print(f"   {user['username']} ({user['email']}) - {user['created_at']}")
 else:
     print("   No recent registrations in the last 7 days")
 
-cursor.close()
-conn.close()
-
 print(f"\n✅ Summary:")
 print("   - Users never write INSERT statements manually")
 print("   - Web forms → API calls → Automatic INSERT statements")
@@ -5,10 +5,13 @@ Simple test of Python backup and restore scripts functionality
 
 import os
 import sys
-import subprocess
 import time
+import logging
 from datetime import datetime
 
+# backup.py and restore.py are imported and driven in-process instead of spawned
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'db'))
+
 def log_step(message, status="INFO"):
     """Log with timestamp"""
     timestamp = datetime.now().strftime('%H:%M:%S')
@@ -16,6 +19,17 @@ def log_step(message, status="INFO"):
     icon = icons.get(status, "📝")
     print(f"[{timestamp}] {icon} {message}")
 
+class VerificationLines(logging.Handler):
+    """Collect the restore's 'users; -> count' verification log lines"""
+    def __init__(self):
+        super().__init__()
+        self.lines = []
+
+    def emit(self, record):
+        message = record.getMessage()
+        if "users;" in message and "->" in message:
+            self.lines.append(message)
+
 def test_python_scripts():
     """Test Python backup and restore scripts"""
     print("🐍 PYTHON BACKUP & RESTORE SCRIPTS TEST")
@@ -37,27 +51,22 @@ def test_python_scripts():
     
     # Test backup script help
     try:
-        result = subprocess.run([sys.executable, backup_script, "--help"], 
-                              capture_output=True, text=True, timeout=10)
-        if result.returncode == 0:
-            log_step("backup.py help works", "SUCCESS")
-            print("Backup options:", result.stdout.split('\n')[1:4])
-        else:
-            log_step("backup.py help failed", "ERROR")
+        import backup
+        help_text = backup.build_parser().format_help()
+        log_step("backup.py help works", "SUCCESS")
+        print("Backup options:", help_text.split('\n')[1:4])
     except Exception as e:
         log_step(f"backup.py help error: {e}", "ERROR")
     
     # Test restore script help
     try:
-        result = subprocess.run([sys.executable, restore_script, "--help"], 
-                              capture_output=True, text=True, timeout=10)
-        if result.returncode == 0:
-            log_step("restore.py help works", "SUCCESS")
-            print("Restore options:", result.stdout.split('\n')[1:4])
-        else:
-            log_step("restore.py help failed", "ERROR")
+        import restore
+        help_text = restore.build_parser().format_help()
+        log_step("restore.py help works", "SUCCESS")
+        print("Restore options:", help_text.split('\n')[1:4])
     except Exception as e:
         log_step(f"restore.py help error: {e}", "ERROR")
+        return
     
     # List available backups
     log_step("Checking available backups")
@@ -75,31 +84,27 @@ def test_python_scripts():
             # Test restore with latest backup
             log_step(f"Testing restore with {latest_backup}")
             
+            verification = VerificationLines()
+            logging.getLogger(restore.__name__).addHandler(verification)
             try:
                 start_time = time.time()
-                result = subprocess.run([
-                    sys.executable, restore_script,
-                    f"backups/{latest_backup}",
-                    "--force"
-                ], capture_output=True, text=True, timeout=120)
-                
+                success = restore.restore_file(f"backups/{latest_backup}", force=True)
                 duration = time.time() - start_time
                 
-                if result.returncode == 0:
+                if success:
                     log_step(f"Restore successful in {duration:.2f}s", "SUCCESS")
                     
-                    # Parse output for user count
-                    for line in result.stdout.split('\n'):
-                        if "users;" in line and "->" in line:
-                            log_step(f"Verification: {line.strip()}")
+                    # Report the user count from the restore's verification step
+                    for line in verification.lines:
+                        log_step(f"Verification: {line.strip()}")
                             
                 else:
-                    log_step(f"Restore failed: {result.stderr[:100]}...", "ERROR")
+                    log_step("Restore failed, see backups/restore.log", "ERROR")
                     
-            except subprocess.TimeoutExpired:
-                log_step("Restore timed out", "ERROR")
             except Exception as e:
                 log_step(f"Restore error: {e}", "ERROR")
+            finally:
+                logging.getLogger(restore.__name__).removeHandler(verification)
         else:
             log_step("No backup files found for testing", "WARNING")
     else:
@@ -5,6 +5,7 @@ Simple test to restore the specific backup with 10,003 users using Python direct
 
 import os
 import sys
+import atexit
 import subprocess
 from datetime import datetime
 
@@ -13,7 +14,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
 
 try:
     from dotenv import load_dotenv
-    import psycopg2
+    from psycopg2 import pool
 except ImportError as e:
     print(f"Error importing required modules: {e}")
     print("Please install: pip install psycopg2-binary python-dotenv")
@@ -31,25 +32,38 @@ db_config = {
     'database': os.getenv('DB_NAME', 'ecommerce_db')
 }
 
+# Pool shared by every get_user_count call, opened on first use
+_pool = None
+
 def get_user_count():
     """Get current user count"""
+    global _pool
+    try:
+        if _pool is None:
+            _pool = pool.ThreadedConnectionPool(1, 4, **db_config)
+        conn = _pool.getconn()
+    except Exception as e:
+        print(f"Error getting user count: {e}")
+        return None
     try:
-        conn = psycopg2.connect(
-            host=db_config['host'],
-            port=db_config['port'],
-            user=db_config['user'],
-            password=db_config['password'],
-            database=db_config['database']
-        )
-        cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM users;")
-        count = cursor.fetchone()[0]
-        cursor.close()
-        conn.close()
-        return count
+        conn.autocommit = True
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT COUNT(*) FROM users;")
+            return cursor.fetchone()[0]
     except Exception as e:
         print(f"Error getting user count: {e}")
         return None
+    finally:
+        _pool.putconn(conn, close=conn.closed != 0)
+
+def release_connection():
+    """Close the pooled connections; a restore can't drop a database that still has sessions"""
+    global _pool
+    if _pool is not None:
+        _pool.closeall()
+        _pool = None
+
+atexit.register(release_connection)
 
 def simple_restore_test():
     """Simple restore test"""
@@ -76,6 +90,8 @@ def simple_restore_test():
         print(f"   Restoring: {backup_file}")
         
         try:
+            release_connection()
+            
             # Run the restore script
             result = subprocess.run([
                 sys.executable, restore_script_path, backup_file
@@ -113,4 +129,7 @@ def simple_restore_test():
         print(f"❌ Restore script not found: {restore_script_path}")
 
 if __name__ == "__main__":
-    simple_restore_test()
+    try:
+        simple_restore_test()
+    finally:
+        release_connection()
@@ -6,6 +6,7 @@ Simplified diagnostic for restore router issues
 import requests
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 # Configuration
 BACKEND_URL = "http://localhost:3001/api"
@@ -21,10 +22,21 @@ def main():
     print("🔍 SIMPLE RESTORE DIAGNOSTIC")
     print("=" * 50)
     
+    with requests.Session() as session:
+        run_diagnostic(session)
+
+def run_diagnostic(session):
+    """Run the diagnostic steps over one keep-alive session"""
+    # Health and login don't depend on each other; send both in one round trip
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        health_probe = executor.submit(session.get, f"{BACKEND_URL}/health", timeout=5)
+        login_probe = executor.submit(session.post, f"{BACKEND_URL}/users/login",
+                                      json=ADMIN_CREDENTIALS, timeout=5)
+    
     # 1. Check if backend is running
     print("1. Backend server status...")
     try:
-        response = requests.get(f"{BACKEND_URL}/health", timeout=5)
+        response = health_probe.result()
         if response.status_code == 200:
             print("   ✅ Backend server is running")
         else:
@@ -37,10 +49,11 @@ def main():
     # 2. Test authentication
     print("\n2. Authentication test...")
     try:
-        response = requests.post(f"{BACKEND_URL}/users/login", json=ADMIN_CREDENTIALS)
+        response = login_probe.result()
         if response.status_code == 200:
             data = response.json()
             token = data.get('data', {}).get('token') or data.get('token')
+            session.headers["Authorization"] = f"Bearer {token}"
             print("   ✅ Authentication successful")
         else:
             print(f"   ❌ Authentication failed: {response.status_code}")
@@ -52,16 +65,15 @@ def main():
     # 3. Check backup file listing
     print("\n3. Backup file listing...")
     try:
-        headers = {"Authorization": f"Bearer {token}"}
-        response = requests.get(f"{BACKEND_URL}/database/backups", headers=headers)
+        response = session.get(f"{BACKEND_URL}/database/backups")
         if response.status_code == 200:
             data = response.json()
             backups = data.get('data', {}).get('backups', [])
             print(f"   ✅ Found {len(backups)} backup files")
             
             # Check if target backup exists
-            target_found = any(backup['filename'] == BACKUP_FILENAME for backup in backups)
-            if target_found:
+            names = {backup['filename'] for backup in backups}
+            if BACKUP_FILENAME in names:
                 print(f"   ✅ Target backup found: {BACKUP_FILENAME}")
             else:
                 print(f"   ❌ Target backup not found: {BACKUP_FILENAME}")
@@ -79,12 +91,10 @@ def main():
     # 4. Test restore API call
     print("\n4. Restore API test...")
     try:
-        headers = {"Authorization": f"Bearer {token}"}
         payload = {"filename": BACKUP_FILENAME, "force": True}
         
         print(f"   Attempting restore of: {BACKUP_FILENAME}")
-        response = requests.post(f"{BACKEND_URL}/database/restore", 
-                               headers=headers, 
+        response = session.post(f"{BACKEND_URL}/database/restore", 
                                json=payload,
                                timeout=120)  # 2 minute timeout
         
@@ -3,9 +3,40 @@
 import requests
 import json
 import sys
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+
+# A dead server fails after one reconnect; 502/503/504 on GET probes are retried twice
+RETRY_POLICY = Retry(total=2, connect=1, backoff_factor=0.2,
+                     status_forcelist=[502, 503, 504],
+                     allowed_methods=frozenset(['GET']),
+                     raise_on_status=False)
+
+# Core API probes: (label, method, path, JSON body, whether the reply must report success)
+CORE_API_CHECKS = [
+    ("Analytics endpoint", "GET", "/api/analytics/system-performance", None, False),
+    ("Database query endpoint", "POST", "/api/database/execute-query",
+     {"query": "SELECT COUNT(*) FROM users;"}, True),
+    ("User management endpoint", "GET", "/api/users/profile", None, False)
+]
+
+def create_session():
+    """Session shared by every check so requests reuse keep-alive connections"""
+    session = requests.Session()
+    session.headers.update({'Content-Type': 'application/json'})
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=RETRY_POLICY)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
 
 def check_system_health():
     """Comprehensive system health check"""
+    with create_session() as session:
+        return run_health_checks(session)
+
+def run_health_checks(session):
+    """Run every check over the given session"""
     base_url = "http://localhost:3001"
     frontend_url = "http://localhost:3000"
     
@@ -14,13 +45,23 @@ def check_system_health():
     
     errors_found = []
     warnings_found = []
+    token = None  # set by the login in section 3 and reused for the API checks
+    
+    # The backend, frontend and login probes are independent, so send them together;
+    # result() re-raises any request error inside the matching section below
+    login_data = {"email": "admin@example.com", "password": "admin123"}
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        backend_probe = executor.submit(session.get, f"{base_url}/health", timeout=5)
+        frontend_probe = executor.submit(session.get, frontend_url, timeout=5)
+        login_probe = executor.submit(session.post, f"{base_url}/api/users/login",
+                                      json=login_data, timeout=5)
     
     # 1. Test Backend Health
     print("\n1. BACKEND HEALTH CHECK")
     print("-" * 30)
     
     try:
-        response = requests.get(f"{base_url}/health", timeout=5)
+        response = backend_probe.result()
         if response.status_code == 200:
             print("✅ Backend server is responding")
         else:
@@ -41,7 +82,7 @@ def check_system_health():
     print("-" * 30)
     
     try:
-        response = requests.get(frontend_url, timeout=5)
+        response = frontend_probe.result()
         if response.status_code == 200:
             print("✅ Frontend server is responding")
         else:
@@ -62,9 +103,8 @@ def check_system_health():
     print("-" * 30)
     
     try:
-        # Try to login first
-        login_data = {"email": "admin@example.com", "password": "admin123"}
-        response = requests.post(f"{base_url}/api/users/login", json=login_data, timeout=5)
+        # Login result from the concurrent probes above
+        response = login_probe.result()
         
         if response.status_code == 200:
             result = response.json()
@@ -73,9 +113,11 @@ def check_system_health():
                 if token:
                     print("✅ Database connection and authentication working")
                     
+                    # Every later request on the session carries the token
+                    session.headers['Authorization'] = f'Bearer {token}'
+                    
                     # Test basic database query
-                    headers = {'Authorization': f'Bearer {token}'}
-                    response = requests.get(f"{base_url}/api/analytics/system-status", headers=headers, timeout=5)
+                    response = session.get(f"{base_url}/api/analytics/system-status", timeout=5)
                     
                     if response.status_code == 200:
                         status_result = response.json()
@@ -117,62 +159,36 @@ def check_system_health():
     print("\n4. CORE API ENDPOINTS CHECK")
     print("-" * 30)
     
-    if not errors_found:  # Only test if basic connectivity works
+    if not errors_found and token:  # Only test if basic connectivity works
         try:
-            # Re-login for API tests
-            login_data = {"email": "admin@example.com", "password": "admin123"}
-            response = requests.post(f"{base_url}/api/users/login", json=login_data)
-            token = response.json().get('data', {}).get('token')
-            headers = {'Authorization': f'Bearer {token}', 'Content-Type': 'application/json'}
-            
-            # Test Analytics endpoint
-            try:
-                response = requests.get(f"{base_url}/api/analytics/system-performance", headers=headers, timeout=5)
-                if response.status_code == 200:
-                    print("✅ Analytics endpoint working")
-                else:
-                    error_msg = f"❌ Analytics endpoint failed: {response.status_code}"
-                    print(error_msg)
-                    errors_found.append(error_msg)
-            except Exception as e:
-                error_msg = f"❌ Analytics endpoint error: {str(e)}"
-                print(error_msg)
-                errors_found.append(error_msg)
-            
-            # Test Database Tools endpoint
-            try:
-                query_data = {"query": "SELECT COUNT(*) FROM users;"}
-                response = requests.post(f"{base_url}/api/database/execute-query", json=query_data, headers=headers, timeout=5)
-                if response.status_code == 200:
-                    result = response.json()
-                    if result.get('success'):
-                        print("✅ Database query endpoint working")
-                    else:
-                        error_msg = f"❌ Database query failed: {result.get('message')}"
+            # The session already carries the token from section 3
+            # Probe the independent endpoints concurrently; wall time is the slowest one
+            with ThreadPoolExecutor(max_workers=len(CORE_API_CHECKS)) as executor:
+                futures = [
+                    (label, check_success, executor.submit(
+                        session.request, method, f"{base_url}{path}", json=body, timeout=5
+                    ))
+                    for label, method, path, body, check_success in CORE_API_CHECKS
+                ]
+                
+                # Report in declaration order so the output reads the same on every run
+                for label, check_success, future in futures:
+                    try:
+                        response = future.result()
+                        if response.status_code != 200:
+                            error_msg = f"❌ {label} failed: {response.status_code}"
+                            print(error_msg)
+                            errors_found.append(error_msg)
+                        elif check_success and not response.json().get('success'):
+                            error_msg = f"❌ {label} failed: {response.json().get('message')}"
+                            print(error_msg)
+                            errors_found.append(error_msg)
+                        else:
+                            print(f"✅ {label} working")
+                    except Exception as e:
+                        error_msg = f"❌ {label} error: {str(e)}"
                         print(error_msg)
                         errors_found.append(error_msg)
-                else:
-                    error_msg = f"❌ Database query endpoint failed: {response.status_code}"
-                    print(error_msg)
-                    errors_found.append(error_msg)
-            except Exception as e:
-                error_msg = f"❌ Database query endpoint error: {str(e)}"
-                print(error_msg)
-                errors_found.append(error_msg)
-            
-            # Test User Management
-            try:
-                response = requests.get(f"{base_url}/api/users/profile", headers=headers, timeout=5)
-                if response.status_code == 200:
-                    print("✅ User management endpoint working")
-                else:
-                    error_msg = f"❌ User management endpoint failed: {response.status_code}"
-                    print(error_msg)
-                    errors_found.append(error_msg)
-            except Exception as e:
-                error_msg = f"❌ User management endpoint error: {str(e)}"
-                print(error_msg)
-                errors_found.append(error_msg)
                 
         except Exception as e:
             error_msg = f"❌ API testing error: {str(e)}"
@@ -187,32 +203,24 @@ def check_system_health():
     
     import os
     
-    # Check if backup directory exists
-    backup_dir = "d:\\year2\\year2_term3\\DatabaseAdmin\\project_db\\backups"
-    if os.path.exists(backup_dir):
-        print("✅ Backup directory exists")
-    else:
-        warning_msg = "⚠️  Backup directory missing"
-        print(warning_msg)
-        warnings_found.append(warning_msg)
-    
-    # Check if .env file exists
-    env_file = "d:\\year2\\year2_term3\\DatabaseAdmin\\project_db\\backend\\.env"
-    if os.path.exists(env_file):
-        print("✅ Backend .env file exists")
-    else:
-        error_msg = "❌ Backend .env file missing"
-        print(error_msg)
-        errors_found.append(error_msg)
+    # (label, path, whether a missing path is an error rather than a warning)
+    required_paths = [
+        ("Backup directory", "d:\\year2\\year2_term3\\DatabaseAdmin\\project_db\\backups", False),
+        ("Backend .env file", "d:\\year2\\year2_term3\\DatabaseAdmin\\project_db\\backend\\.env", True),
+        ("Database schema file", "d:\\year2\\year2_term3\\DatabaseAdmin\\project_db\\db\\schema.sql", True)
+    ]
     
-    # Check database schema file
-    schema_file = "d:\\year2\\year2_term3\\DatabaseAdmin\\project_db\\db\\schema.sql"
-    if os.path.exists(schema_file):
-        print("✅ Database schema file exists")
-    else:
-        error_msg = "❌ Database schema file missing"
-        print(error_msg)
-        errors_found.append(error_msg)
+    for label, path, is_error in required_paths:
+        if os.path.exists(path):
+            print(f"✅ {label} exists")
+        elif is_error:
+            error_msg = f"❌ {label} missing"
+            print(error_msg)
+            errors_found.append(error_msg)
+        else:
+            warning_msg = f"⚠️  {label} missing"
+            print(warning_msg)
+            warnings_found.append(warning_msg)
     
     # 6. Summary
     print(f"\n6. SYSTEM HEALTH SUMMARY")
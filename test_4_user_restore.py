@@ -4,12 +4,18 @@ Test script for 4-user backup restore
 """
 import os
 import re
+import io
+import csv
+import mmap
 import subprocess
 import psycopg2
 from dotenv import load_dotenv
 
 load_dotenv('backend/.env')
 
+# Data block of the users COPY statement, up to the \. terminator
+_COPY_USERS_RE = re.compile(rb'COPY public\.users.*?FROM stdin;\n(.*?)\n\\\.', re.DOTALL)
+
 def analyze_backup_file(filename):
     """Analyze backup file and show user details"""
     backup_path = os.path.join('backups', filename)
@@ -18,32 +24,31 @@ def analyze_backup_file(filename):
     print("=" * 60)
     
     try:
-        with open(backup_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        # Map the dump instead of reading it; only the matched pages get touched
+        with open(backup_path, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            user_match = _COPY_USERS_RE.search(content)
+            users_data = user_match.group(1).decode('utf-8', 'replace').strip() if user_match else ''
+            has_creates = content.find(b'CREATE DATABASE') != -1 or content.find(b'CREATE TABLE') != -1
+            has_drops = content.find(b'DROP DATABASE') != -1
         
-        # Find users section
-        user_match = re.search(r'COPY public\.users.*?FROM stdin;\n(.*?)\n\\\\.', content, re.DOTALL)
         if user_match:
-            users_data = user_match.group(1).strip()
-            user_lines = [line.strip() for line in users_data.split('\n') if line.strip()]
+            # COPY text rows are tab separated and never quoted
+            user_rows = [
+                row for row in csv.reader(io.StringIO(users_data), delimiter='\t', quoting=csv.QUOTE_NONE)
+                if row
+            ]
             
-            print(f"📊 Total users in backup: {len(user_lines)}")
+            print(f"📊 Total users in backup: {len(user_rows)}")
             print("\n👥 User details:")
             
-            for i, line in enumerate(user_lines, 1):
-                parts = line.split('\t')
-                if len(parts) >= 13:
-                    username = parts[1]
-                    email = parts[2]
-                    first_name = parts[4]
-                    last_name = parts[5]
-                    role = parts[12]
-                    print(f"  {i}. {username:<15} | {email:<25} | {first_name} {last_name:<10} | {role}")
+            # parts: 1 username, 2 email, 4 first name, 5 last name, 12 role
+            print('\n'.join(
+                f"  {i}. {parts[1]:<15} | {parts[2]:<25} | {parts[4]} {parts[5]:<10} | {parts[12]}"
+                for i, parts in enumerate(user_rows, 1) if len(parts) >= 13
+            ))
             
             # Check if it's a full backup or data-only
-            has_creates = 'CREATE DATABASE' in content or 'CREATE TABLE' in content
-            has_drops = 'DROP DATABASE' in content
-            
             print(f"\n📝 Backup type:")
             print(f"   Contains CREATE statements: {'Yes' if has_creates else 'No'}")
             print(f"   Contains DROP DATABASE: {'Yes' if has_drops else 'No'}")
@@ -57,7 +62,7 @@ def analyze_backup_file(filename):
             
             print(f"   Type: {backup_type}")
             
-            return len(user_lines), backup_type
+            return len(user_rows), backup_type
         else:
             print("❌ No user data found in backup file")
             return 0, "No data"
@@ -9,6 +9,10 @@ import sys
 import time
 import requests
 import subprocess
+import threading
+from collections import deque
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
 
 # Configuration
@@ -16,26 +20,44 @@ BACKEND_URL = "http://localhost:3001"
 ADMIN_EMAIL = "admin@example.com"
 ADMIN_PASSWORD = "admin123"
 
+# Retry connection failures once and gateway errors twice with a short backoff;
+# status retries are limited to GET so a backup/restore/query POST never runs twice
+RETRY_POLICY = Retry(total=2, connect=1, backoff_factor=0.2,
+                     status_forcelist=[502, 503, 504],
+                     allowed_methods=frozenset(['GET']),
+                     raise_on_status=False)
+
+# Status icons used by log_step
+_ICONS = {
+    "INFO": "ℹ️",
+    "SUCCESS": "✅",
+    "ERROR": "❌",
+    "WARNING": "⚠️"
+}
+
 def log_step(category, message, status="INFO"):
     """Log a step with timestamp and status"""
-    timestamp = datetime.now().strftime('%H:%M:%S')
-    icons = {
-        "INFO": "ℹ️",
-        "SUCCESS": "✅",
-        "ERROR": "❌",
-        "WARNING": "⚠️"
-    }
-    icon = icons.get(status, "📝")
-    print(f"[{timestamp}] {icon} {category}: {message}")
+    print(f"[{time.strftime('%H:%M:%S')}] {_ICONS.get(status, '📝')} {category}: {message}")
 
-def get_auth_token():
-    """Get authentication token for API calls"""
+def create_session():
+    """Session shared by every API call so they reuse keep-alive connections"""
+    session = requests.Session()
+    session.headers['Accept'] = 'application/json'  # every endpoint used here replies with JSON
+    adapter = HTTPAdapter(pool_maxsize=4, max_retries=RETRY_POLICY)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+def get_auth_token(session):
+    """Log in once and attach the token to the session for later API calls"""
     try:
-        response = requests.post(f"{BACKEND_URL}/api/users/login", 
+        response = session.post(f"{BACKEND_URL}/api/users/login", 
                                json={"email": ADMIN_EMAIL, "password": ADMIN_PASSWORD})
         
         if response.status_code == 200:
-            return response.json()['data']['token']
+            token = response.json()['data']['token']
+            session.headers["Authorization"] = f"Bearer {token}"
+            return token
         else:
             log_step("AUTH", f"Login failed: {response.text}", "ERROR")
             return None
@@ -43,13 +65,11 @@ def get_auth_token():
         log_step("AUTH", f"Login error: {e}", "ERROR")
         return None
 
-def check_current_user_count(token):
+def check_current_user_count(session):
     """Check current user count in database via API"""
     try:
-        headers = {"Authorization": f"Bearer {token}"}
-        response = requests.post(f"{BACKEND_URL}/api/database/query", 
-                               json={"sql": "SELECT COUNT(*) as count FROM users"}, 
-                               headers=headers)
+        response = session.post(f"{BACKEND_URL}/api/database/query", 
+                               json={"sql": "SELECT COUNT(*) as count FROM users"})
         
         if response.status_code == 200:
             count = response.json()['data']['rows'][0]['count']
@@ -62,17 +82,16 @@ def check_current_user_count(token):
         log_step("CHECK", f"Query error: {e}", "ERROR")
         return None
 
-def test_javascript_api_backup(token):
+def test_javascript_api_backup(session):
     """Test JavaScript/API backup functionality"""
     log_step("JS-BACKUP", "Testing JavaScript API backup")
     
     try:
-        headers = {"Authorization": f"Bearer {token}"}
         start_time = time.time()
         
-        response = requests.post(f"{BACKEND_URL}/api/database/backup", 
+        response = session.post(f"{BACKEND_URL}/api/database/backup", 
                                json={"backupType": "complete"}, 
-                               headers=headers, timeout=120)
+                               timeout=120)
         
         duration = time.time() - start_time
         
@@ -89,17 +108,16 @@ def test_javascript_api_backup(token):
         log_step("JS-BACKUP", f"Error: {e}", "ERROR")
         return None
 
-def test_javascript_api_restore(token, filename):
+def test_javascript_api_restore(session, filename):
     """Test JavaScript/API restore functionality"""
     log_step("JS-RESTORE", f"Testing JavaScript API restore with {filename}")
     
     try:
-        headers = {"Authorization": f"Bearer {token}"}
         start_time = time.time()
         
-        response = requests.post(f"{BACKEND_URL}/api/database/restore", 
+        response = session.post(f"{BACKEND_URL}/api/database/restore", 
                                json={"filename": filename, "force": True}, 
-                               headers=headers, timeout=120)
+                               timeout=120)
         
         duration = time.time() - start_time
         
@@ -126,37 +144,48 @@ def test_python_restore(filename):
     try:
         start_time = time.time()
         
-        result = subprocess.run([
+        # Stream the child's output instead of buffering all of it; stderr is merged in
+        proc = subprocess.Popen([
             sys.executable, 
             os.path.join("db", "restore.py"),
             f"backups/{filename}",
             "--force"
-        ], capture_output=True, text=True, timeout=120)
+        ], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1)
         
-        duration = time.time() - start_time
+        # Reading stdout blocks, so the timeout is enforced by killing the child
+        timed_out = threading.Event()
         
-        if result.returncode == 0:
-            # Parse output to find user count
-            output = result.stdout
-            user_count = "unknown"
-            
-            for line in output.split('\n'):
+        def kill_on_timeout():
+            timed_out.set()
+            proc.kill()
+        
+        timer = threading.Timer(120, kill_on_timeout)
+        timer.start()
+        user_count = "unknown"
+        recent_lines = deque(maxlen=20)  # kept for the failure message
+        try:
+            for line in proc.stdout:
+                recent_lines.append(line)
                 if "users;" in line and "->" in line:
-                    try:
-                        user_count = line.split("->")[-1].strip()
-                    except:
-                        pass
-            
+                    user_count = line.rsplit("->", 1)[-1].strip()
+            proc.wait()
+        finally:
+            timer.cancel()
+            proc.stdout.close()
+        
+        duration = time.time() - start_time
+        
+        if proc.returncode == 0:
             log_step("PY-RESTORE", f"Success - {user_count} users restored", "SUCCESS")
             log_step("PY-RESTORE", f"Duration: {duration:.2f}s", "INFO")
             return user_count
+        elif timed_out.is_set():
+            log_step("PY-RESTORE", "Timed out", "ERROR")
+            return None
         else:
-            log_step("PY-RESTORE", f"Failed: {result.stderr}", "ERROR")
+            log_step("PY-RESTORE", f"Failed: {''.join(recent_lines)}", "ERROR")
             return None
             
-    except subprocess.TimeoutExpired:
-        log_step("PY-RESTORE", "Timed out", "ERROR")
-        return None
     except Exception as e:
         log_step("PY-RESTORE", f"Error: {e}", "ERROR")
         return None
@@ -167,19 +196,21 @@ def list_available_backups():
     
     backups_dir = "backups"
     if os.path.exists(backups_dir):
-        backup_files = [f for f in os.listdir(backups_dir) if f.endswith('.sql')]
-        backup_files.sort(key=lambda x: os.path.getmtime(os.path.join(backups_dir, x)), reverse=True)
+        # DirEntry caches its stat result, so each file is stat'ed once
+        with os.scandir(backups_dir) as it:
+            entries = [e for e in it if e.name.endswith('.sql') and e.is_file()]
+        entries.sort(key=lambda e: e.stat().st_mtime, reverse=True)
         
-        log_step("BACKUPS", f"Found {len(backup_files)} backup files", "SUCCESS")
+        log_step("BACKUPS", f"Found {len(entries)} backup files", "SUCCESS")
         
         # Show top 5 most recent
-        for i, filename in enumerate(backup_files[:5], 1):
-            filepath = os.path.join(backups_dir, filename)
-            size = os.path.getsize(filepath) / 1024 / 1024  # MB
-            mtime = datetime.fromtimestamp(os.path.getmtime(filepath))
-            log_step("BACKUPS", f"  {i}. {filename} ({size:.2f} MB, {mtime.strftime('%Y-%m-%d %H:%M')})")
+        for i, entry in enumerate(entries[:5], 1):
+            stat = entry.stat()
+            size = stat.st_size / 1024 / 1024  # MB
+            mtime = datetime.fromtimestamp(stat.st_mtime)
+            log_step("BACKUPS", f"  {i}. {entry.name} ({size:.2f} MB, {mtime.strftime('%Y-%m-%d %H:%M')})")
         
-        return backup_files
+        return [entry.name for entry in entries]
     else:
         log_step("BACKUPS", "Backups directory not found", "ERROR")
         return []
@@ -227,8 +258,13 @@ def main():
     print("Testing both Python scripts and JavaScript API methods")
     print("="*80)
     
-    # Get authentication token
-    token = get_auth_token()
+    with create_session() as session:
+        run_comparison(session)
+
+def run_comparison(session):
+    """Run every backup/restore method over the given session"""
+    # Log in once; the token stays on the session headers
+    token = get_auth_token(session)
     if not token:
         print("❌ Cannot proceed without authentication")
         return
@@ -236,7 +272,7 @@ def main():
     log_step("INIT", "Authentication successful", "SUCCESS")
     
     # Check initial state
-    initial_users = check_current_user_count(token)
+    initial_users = check_current_user_count(session)
     
     # List available backups
     backup_files = list_available_backups()
@@ -254,10 +290,10 @@ def main():
     print(f"{'-'*60}")
     
     # Test JavaScript API backup
-    new_backup = test_javascript_api_backup(token)
+    new_backup = test_javascript_api_backup(session)
     
     # Test JavaScript API restore
-    js_restore_result = test_javascript_api_restore(token, test_backup)
+    js_restore_result = test_javascript_api_restore(session, test_backup)
     
     print(f"\n{'-'*60}")
     print("🐍 TESTING PYTHON SCRIPT METHODS")
@@ -270,7 +306,7 @@ def main():
     py_restore_result = test_python_restore(test_backup)
     
     # Final verification
-    final_users = check_current_user_count(token)
+    final_users = check_current_user_count(session)
     
     print(f"\n{'='*80}")
     print("📊 COMPARISON RESULTS")
@@ -8,7 +8,11 @@ import requests
 import json
 import sys
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Configuration
 MAIN_APP_BASE = "http://localhost:3001/api"
@@ -24,13 +28,32 @@ EMERGENCY_CREDENTIALS = {
     "username": "emergency_admin",
     "password": "EmergencyRestore2025!"
 }
+EMERGENCY_TOKEN_TTL = 55 * 60  # seconds a cached emergency token is reused
 
-def test_main_app_login():
+# Servers that are still starting get a reconnect and two retries on 502/503/504;
+# status retries stay on GET so the backup POST can't run twice
+RETRY_POLICY = Retry(total=2, connect=1, backoff_factor=0.2,
+                     status_forcelist=(502, 503, 504),
+                     allowed_methods=frozenset(["GET"]),
+                     raise_on_status=False)
+
+_emergency_login_lock = threading.Lock()
+
+def create_session():
+    """Session shared by every test so calls to ports 3000-3002 reuse keep-alive connections"""
+    session = requests.Session()
+    session.headers.update({"Content-Type": "application/json"})
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=RETRY_POLICY)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+def test_main_app_login(session):
     """Test main application admin login"""
     print("🔐 Testing Main Application Login...")
     
     try:
-        response = requests.post(f"{MAIN_APP_BASE}/users/login", json=ADMIN_CREDENTIALS)
+        response = session.post(f"{MAIN_APP_BASE}/users/login", json=ADMIN_CREDENTIALS)
         
         if response.status_code == 200:
             data = response.json()
@@ -50,167 +73,179 @@ def test_main_app_login():
         print(f"❌ Login error: {e}")
         return None
 
-def test_emergency_recovery():
+def get_emergency_token(session):
+    """Log in to the emergency API, reusing the token until it expires; returns (token, error message)"""
+    # Emergency tests run concurrently, so only one of them may perform the login
+    with _emergency_login_lock:
+        if getattr(session, 'emergency_token_expires', 0) <= time.time():
+            response = session.post(f"{EMERGENCY_API_BASE}/login", json=EMERGENCY_CREDENTIALS, timeout=5)
+            if response.status_code != 200:
+                return None, f"Emergency login request failed: {response.status_code}"
+            data = response.json()
+            if not data.get('success'):
+                return None, f"Emergency login failed: {data.get('message')}"
+            session.emergency_token = data['data']['token']
+            session.emergency_token_expires = time.time() + EMERGENCY_TOKEN_TTL
+        return session.emergency_token, None
+
+def test_emergency_recovery(session, log=print):
     """Test emergency recovery system"""
-    print("\n🚨 Testing Emergency Recovery System...")
+    log("\n🚨 Testing Emergency Recovery System...")
     
     try:
         # Test emergency login
-        response = requests.post(f"{EMERGENCY_API_BASE}/login", json=EMERGENCY_CREDENTIALS)
+        emergency_token, login_error = get_emergency_token(session)
+        if not emergency_token:
+            log(f"❌ {login_error}")
+            return False
+        log("✅ Emergency authentication successful!")
         
-        if response.status_code == 200:
-            data = response.json()
-            if data.get('success'):
-                print("✅ Emergency authentication successful!")
-                emergency_token = data['data']['token']
-                
-                # Test backup listing
-                headers = {"Authorization": f"Bearer {emergency_token}"}
-                backup_response = requests.get(f"{EMERGENCY_API_BASE}/backups", headers=headers)
-                
-                if backup_response.status_code == 200:
-                    backup_data = backup_response.json()
-                    if backup_data.get('success'):
-                        backups = backup_data['data']['backups']
-                        print(f"✅ Found {len(backups)} backup files")
-                        if backups:
-                            latest = backups[0]
-                            print(f"   Latest: {latest['filename']} ({latest['sizeFormatted']})")
-                        return True
-                    else:
-                        print(f"❌ Backup listing failed: {backup_data.get('message')}")
-                        return False
-                else:
-                    print(f"❌ Backup listing request failed: {backup_response.status_code}")
-                    return False
+        # Test backup listing
+        headers = {"Authorization": f"Bearer {emergency_token}"}
+        backup_response = session.get(f"{EMERGENCY_API_BASE}/backups", headers=headers)
+        
+        if backup_response.status_code == 200:
+            backup_data = backup_response.json()
+            if backup_data.get('success'):
+                backups = backup_data['data']['backups']
+                log(f"✅ Found {len(backups)} backup files")
+                if backups:
+                    latest = backups[0]
+                    log(f"   Latest: {latest['filename']} ({latest['sizeFormatted']})")
+                return True
             else:
-                print(f"❌ Emergency login failed: {data.get('message')}")
+                log(f"❌ Backup listing failed: {backup_data.get('message')}")
                 return False
         else:
-            print(f"❌ Emergency login request failed: {response.status_code}")
+            log(f"❌ Backup listing request failed: {backup_response.status_code}")
             return False
             
     except Exception as e:
-        print(f"❌ Emergency recovery error: {e}")
+        log(f"❌ Emergency recovery error: {e}")
         return False
 
-def test_frontend_integration():
+def test_frontend_integration(session, log=print):
     """Test frontend integration"""
-    print("\n🌐 Testing Frontend Integration...")
+    log("\n🌐 Testing Frontend Integration...")
     
     try:
         # Test main frontend
-        response = requests.get(FRONTEND_BASE, timeout=5)
+        response = session.get(FRONTEND_BASE, timeout=5)
         if response.status_code == 200:
-            print("✅ Main frontend accessible")
+            log("✅ Main frontend accessible")
         else:
-            print(f"❌ Main frontend returned {response.status_code}")
+            log(f"❌ Main frontend returned {response.status_code}")
             return False
         
         # Test emergency recovery frontend
-        response = requests.get("http://localhost:3002", timeout=5)
+        response = session.get("http://localhost:3002", timeout=5)
         if response.status_code == 200:
-            print("✅ Emergency recovery frontend accessible")
+            log("✅ Emergency recovery frontend accessible")
         else:
-            print(f"❌ Emergency recovery frontend returned {response.status_code}")
+            log(f"❌ Emergency recovery frontend returned {response.status_code}")
             return False
         
         return True
         
     except Exception as e:
-        print(f"❌ Frontend integration error: {e}")
+        log(f"❌ Frontend integration error: {e}")
         return False
 
-def test_database_backup_through_main_app(admin_token):
+def test_database_backup_through_main_app(session, admin_token, log=print):
     """Test database backup through main application"""
-    print("\n💾 Testing Database Backup via Main App...")
+    log("\n💾 Testing Database Backup via Main App...")
     
     try:
         headers = {"Authorization": f"Bearer {admin_token}"}
-        response = requests.post(f"{MAIN_APP_BASE}/database/backup", json={}, headers=headers)
+        response = session.post(f"{MAIN_APP_BASE}/database/backup", json={}, headers=headers)
         
         if response.status_code == 200:
             data = response.json()
             if data.get('success'):
-                print("✅ Database backup successful!")
-                print(f"   Filename: {data['data']['filename']}")
-                print(f"   Size: {data['data']['size']}")
-                print(f"   Timestamp: {data['data']['timestamp']}")
+                log("✅ Database backup successful!")
+                log(f"   Filename: {data['data']['filename']}")
+                log(f"   Size: {data['data']['size']}")
+                log(f"   Timestamp: {data['data']['timestamp']}")
                 return True
             else:
-                print(f"❌ Backup failed: {data.get('message')}")
+                log(f"❌ Backup failed: {data.get('message')}")
                 return False
         else:
-            print(f"❌ Backup request failed: {response.status_code}")
+            log(f"❌ Backup request failed: {response.status_code}")
             return False
             
     except Exception as e:
-        print(f"❌ Backup error: {e}")
+        log(f"❌ Backup error: {e}")
         return False
 
-def test_system_health():
-    """Test overall system health"""
-    print("\n❤️ Testing System Health...")
-    
-    health_checks = []
-    
-    # Get admin token for authenticated requests
-    admin_token = None
-    try:
-        response = requests.post(f"{MAIN_APP_BASE}/users/login", json=ADMIN_CREDENTIALS)
-        if response.status_code == 200:
-            data = response.json()
-            if data.get('success'):
-                admin_token = data['data']['token']
-    except:
-        pass
-    
-    # Main backend health
+def check_main_backend(session, admin_token):
+    """Check the main backend's system-status endpoint"""
     try:
         headers = {"Authorization": f"Bearer {admin_token}"} if admin_token else {}
-        response = requests.get(f"{MAIN_APP_BASE}/analytics/system-status", headers=headers, timeout=5)
+        response = session.get(f"{MAIN_APP_BASE}/analytics/system-status", headers=headers, timeout=5)
         if response.status_code == 200:
-            health_checks.append(("Main Backend", "✅ Healthy"))
-        else:
-            health_checks.append(("Main Backend", f"❌ Status {response.status_code}"))
+            return ("Main Backend", "✅ Healthy")
+        return ("Main Backend", f"❌ Status {response.status_code}")
     except:
-        health_checks.append(("Main Backend", "❌ Unreachable"))
-    
-    # Emergency recovery health
+        return ("Main Backend", "❌ Unreachable")
+
+def check_emergency_health(session):
+    """Check the emergency recovery server's health endpoint"""
     try:
-        response = requests.get("http://localhost:3002/health", timeout=5)
+        response = session.get("http://localhost:3002/health", timeout=5)
         if response.status_code == 200:
-            health_checks.append(("Emergency Recovery", "✅ Healthy"))
-        else:
-            health_checks.append(("Emergency Recovery", f"❌ Status {response.status_code}"))
+            return ("Emergency Recovery", "✅ Healthy")
+        return ("Emergency Recovery", f"❌ Status {response.status_code}")
     except:
-        health_checks.append(("Emergency Recovery", "❌ Unreachable"))
-    
-    # Database connectivity (through emergency system)
+        return ("Emergency Recovery", "❌ Unreachable")
+
+def check_database(session):
+    """Check database connectivity through the emergency system"""
     try:
-        emergency_response = requests.post(f"{EMERGENCY_API_BASE}/login", json=EMERGENCY_CREDENTIALS)
-        if emergency_response.status_code == 200:
-            token = emergency_response.json()['data']['token']
+        token, _ = get_emergency_token(session)
+        if token:
             headers = {"Authorization": f"Bearer {token}"}
-            db_response = requests.get(f"{EMERGENCY_API_BASE}/database-status", headers=headers)
+            db_response = session.get(f"{EMERGENCY_API_BASE}/database-status", headers=headers, timeout=5)
             if db_response.status_code == 200:
                 db_data = db_response.json()['data']
                 status = "✅ Online" if db_data['status'] == 'online' else "❌ Offline"
-                health_checks.append(("Database", f"{status} - {db_data['message']}"))
-            else:
-                health_checks.append(("Database", "❌ Status check failed"))
-        else:
-            health_checks.append(("Database", "❌ Cannot authenticate to check"))
+                return ("Database", f"{status} - {db_data['message']}")
+            return ("Database", "❌ Status check failed")
+        return ("Database", "❌ Cannot authenticate to check")
     except:
-        health_checks.append(("Database", "❌ Unreachable"))
+        return ("Database", "❌ Unreachable")
+
+def test_system_health(session, admin_token, log=print):
+    """Test overall system health"""
+    log("\n❤️ Testing System Health...")
+    
+    # The components are independent, so one slow or hung check doesn't delay the others
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [
+            executor.submit(check_main_backend, session, admin_token),
+            executor.submit(check_emergency_health, session),
+            executor.submit(check_database, session)
+        ]
+        health_checks = [future.result() for future in futures]
     
     for component, status in health_checks:
-        print(f"   {component}: {status}")
+        log(f"   {component}: {status}")
     
     return all("✅" in status for _, status in health_checks)
 
+def run_logged(test, *args):
+    """Run a test, returning its result and the lines it logged"""
+    lines = []
+    result = test(*args, log=lambda *values: lines.append(' '.join(map(str, values))))
+    return result, lines
+
 def main():
     """Run complete integration test"""
+    with create_session() as session:
+        return run_integration_tests(session)
+
+def run_integration_tests(session):
+    """Run every integration test over the given session"""
     print("🧪 COMPLETE DATABASE RECOVERY SYSTEM TEST")
     print("=" * 60)
     print(f"🕒 Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -219,24 +254,32 @@ def main():
     results = {}
     
     # Test main application login
-    admin_token = test_main_app_login()
+    admin_token = test_main_app_login(session)
     results['main_login'] = admin_token is not None
     
-    # Test emergency recovery system
-    results['emergency_recovery'] = test_emergency_recovery()
-    
-    # Test frontend integration
-    results['frontend_integration'] = test_frontend_integration()
-    
-    # Test database backup (if main app login worked)
-    if admin_token:
-        results['database_backup'] = test_database_backup_through_main_app(admin_token)
-    else:
-        results['database_backup'] = False
-        print("\n💾 Skipping database backup test (no admin token)")
+    # The remaining tests hit independent endpoints, so they run concurrently;
+    # each one logs to its own list, printed in the usual order afterwards
+    concurrent_tests = [
+        ('emergency_recovery', test_emergency_recovery, ()),
+        ('frontend_integration', test_frontend_integration, ()),
+        ('database_backup', test_database_backup_through_main_app if admin_token else None, (admin_token,)),
+        ('system_health', test_system_health, (admin_token,))
+    ]
+    with ThreadPoolExecutor(max_workers=len(concurrent_tests)) as executor:
+        futures = {
+            name: executor.submit(run_logged, test, session, *args)
+            for name, test, args in concurrent_tests if test
+        }
     
-    # Test system health
-    results['system_health'] = test_system_health()
+    for name, _, _ in concurrent_tests:
+        if name in futures:
+            results[name], lines = futures[name].result()
+            for line in lines:
+                print(line)
+        else:
+            # Database backup needs the admin token from the main app login
+            results[name] = False
+            print("\n💾 Skipping database backup test (no admin token)")
     
     # Summary
     print("\n" + "=" * 60)
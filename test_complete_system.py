@@ -6,10 +6,44 @@ This validates all components work correctly together
 
 import os
 import sys
+import time
 import requests
-import subprocess
 import psycopg2
 from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# db/restore.py is imported and checked in-process instead of spawned
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'db'))
+
+# Shared keep-alive session; a server still starting gets a reconnect and
+# two retries on 502/503/504 instead of failing the whole run
+session = requests.Session()
+_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=10,
+                       max_retries=Retry(total=2, connect=1, backoff_factor=0.2,
+                                         status_forcelist=(502, 503, 504),
+                                         allowed_methods=frozenset(["GET", "POST"]),
+                                         raise_on_status=False))
+session.mount("http://", _adapter)
+session.mount("https://", _adapter)
+
+EMERGENCY_API_BASE = "http://localhost:3002/api/emergency"
+EMERGENCY_CREDENTIALS = {
+    "username": "emergency_admin",
+    "password": "EmergencyRestore2025!"
+}
+EMERGENCY_TOKEN_TTL = 55 * 60  # seconds a cached emergency token is reused
+
+def get_emergency_token():
+    """Log in to the emergency API, reusing the token on the session until it expires"""
+    if getattr(session, 'emergency_token_expires', 0) > time.time():
+        return session.emergency_token
+    response = session.post(f"{EMERGENCY_API_BASE}/login", json=EMERGENCY_CREDENTIALS)
+    if response.status_code != 200:
+        return None
+    session.emergency_token = response.json().get('data', {}).get('token')
+    session.emergency_token_expires = time.time() + EMERGENCY_TOKEN_TTL
+    return session.emergency_token
 
 def print_header(title):
     print(f"\n{'='*60}")
@@ -20,6 +54,20 @@ def print_section(section):
     print(f"\n📋 {section}")
     print('-'*40)
 
+def present_paths(paths):
+    """Return the subset of paths that exist, listing each parent directory once"""
+    names_by_dir = {}
+    for path in paths:
+        parent = os.path.dirname(path) or "."
+        if parent not in names_by_dir:
+            try:
+                with os.scandir(parent) as entries:
+                    names_by_dir[parent] = {entry.name for entry in entries}
+            except (FileNotFoundError, NotADirectoryError):
+                names_by_dir[parent] = set()
+    return {path for path in paths
+            if os.path.basename(path) in names_by_dir[os.path.dirname(path) or "."]}
+
 def test_database_functionality():
     """Test 1: Core database functionality"""
     print_section("Test 1: Core Database Functionality")
@@ -35,15 +83,13 @@ def test_database_functionality():
         )
         cursor = conn.cursor()
         
-        # Get database stats
-        cursor.execute("SELECT COUNT(*) FROM users")
-        user_count = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(*) FROM products")
-        product_count = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(*) FROM orders")
-        order_count = cursor.fetchone()[0]
+        # Get database stats in one round trip
+        cursor.execute("""
+            SELECT (SELECT COUNT(*) FROM users),
+                   (SELECT COUNT(*) FROM products),
+                   (SELECT COUNT(*) FROM orders)
+        """)
+        user_count, product_count, order_count = cursor.fetchone()
         
         cursor.close()
         conn.close()
@@ -68,21 +114,22 @@ def test_backup_restore_functionality():
             print("❌ Backup directory not found")
             return False
         
-        sql_files = [f for f in os.listdir("backups") if f.endswith('.sql')]
+        with os.scandir("backups") as entries:
+            sql_files = [entry.name for entry in entries if entry.name.endswith('.sql')]
         print(f"✅ Found {len(sql_files)} backup files")
         
         # Test restore script
-        result = subprocess.run(['python', 'db/restore.py', '--help'], 
-                               capture_output=True, text=True)
-        if result.returncode == 0:
+        try:
+            import restore
+            restore.build_parser().format_help()
             print("✅ Restore script accessible")
-        else:
+        except Exception:
             print("❌ Restore script not working")
             return False
         
         # Test with latest backup (dry run)
         if sql_files:
-            latest_backup = sorted(sql_files)[-1]
+            latest_backup = max(sql_files)  # names carry the timestamp; no full sort needed
             print(f"✅ Latest backup: {latest_backup}")
         
         return True
@@ -99,7 +146,7 @@ def test_emergency_recovery_system():
     
     try:
         # Test server availability
-        response = requests.get(f"{base_url}/health", timeout=5)
+        response = session.get(f"{base_url}/health", timeout=5)
         if response.status_code == 200:
             print("✅ Emergency server running")
         else:
@@ -107,14 +154,10 @@ def test_emergency_recovery_system():
             return False
         
         # Test authentication
-        auth_response = requests.post(f"{base_url}/api/emergency/login", json={
-            "username": "emergency_admin",
-            "password": "EmergencyRestore2025!"
-        })
+        token = get_emergency_token()
         
-        if auth_response.status_code == 200:
+        if token:
             print("✅ Emergency authentication working")
-            token = auth_response.json().get('data', {}).get('token')
         else:
             print("❌ Emergency authentication failed")
             return False
@@ -122,22 +165,16 @@ def test_emergency_recovery_system():
         # Test protected endpoints
         headers = {"Authorization": f"Bearer {token}"}
         
-        # Backup listing
-        backup_response = requests.get(f"{base_url}/api/emergency/backups", headers=headers)
-        if backup_response.status_code == 200:
-            backup_data = backup_response.json()
-            backup_count = len(backup_data.get('data', {}).get('backups', []))
+        # Backup listing and server status arrive together in one snapshot
+        snapshot_response = session.get(f"{base_url}/api/emergency/integration-snapshot", headers=headers)
+        if snapshot_response.status_code == 200:
+            snapshot = snapshot_response.json().get('data', {})
+            backup_count = len(snapshot.get('backups', {}).get('backups', []))
+            uptime = snapshot.get('status', {}).get('server', {}).get('uptime', 'N/A')
             print(f"✅ Emergency backup listing: {backup_count} backups")
-        else:
-            print("❌ Emergency backup listing failed")
-        
-        # Status endpoint
-        status_response = requests.get(f"{base_url}/api/emergency/status", headers=headers)
-        if status_response.status_code == 200:
-            status_data = status_response.json()
-            uptime = status_data.get('data', {}).get('server', {}).get('uptime', 'N/A')
             print(f"✅ Emergency status endpoint: Server up {uptime}")
         else:
+            print("❌ Emergency backup listing failed")
             print("❌ Emergency status endpoint failed")
         
         return True
@@ -166,9 +203,10 @@ def test_file_structure():
         ".vscode/tasks.json"
     ]
     
+    present = present_paths(required_files)
     missing_files = []
     for file_path in required_files:
-        if os.path.exists(file_path):
+        if file_path in present:
             print(f"✅ {file_path}")
         else:
             print(f"❌ {file_path} (missing)")
@@ -191,8 +229,9 @@ def test_documentation():
         "README.md"
     ]
     
+    present = present_paths(doc_files)
     for doc in doc_files:
-        if os.path.exists(doc):
+        if doc in present:
             print(f"✅ {doc}")
         else:
             print(f"❌ {doc} (missing)")
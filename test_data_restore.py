@@ -3,76 +3,104 @@
 Test restore with a data backup that contains actual users
 """
 
-import psycopg2
+from psycopg2 import pool
 import os
 import sys
+import atexit
 import subprocess
 from datetime import datetime
 
+# Connections shared by the query helpers, opened on first use
+_pool = None
+
 def get_db_connection():
-    """Get database connection"""
-    return psycopg2.connect(
-        host="localhost",
-        port="5432",
-        database="ecommerce_db",
-        user="postgres",
-        password="hengmengly123"
-    )
+    """Borrow a connection from the shared pool; hand it back with release_db_connection"""
+    global _pool
+    if _pool is None:
+        _pool = pool.SimpleConnectionPool(
+            1, 4,
+            host="localhost",
+            port="5432",
+            database="ecommerce_db",
+            user="postgres",
+            password="hengmengly123"
+        )
+    conn = _pool.getconn()
+    conn.autocommit = True
+    return conn
+
+def release_db_connection(conn):
+    """Return a borrowed connection to the pool, dropping it if it broke"""
+    _pool.putconn(conn, close=conn.closed != 0)
+
+def close_db_connections():
+    """Close every pooled connection; a restore can't drop a database that still has sessions"""
+    global _pool
+    if _pool is not None:
+        _pool.closeall()
+        _pool = None
+
+atexit.register(close_db_connections)
 
 def get_user_count():
     """Get current number of users"""
     try:
         conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM users")
-        count = cursor.fetchone()[0]
-        cursor.close()
-        conn.close()
-        return count
     except Exception as e:
         print(f"Error getting user count: {e}")
         return None
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT COUNT(*) FROM users")
+            return cursor.fetchone()[0]
+    except Exception as e:
+        print(f"Error getting user count: {e}")
+        return None
+    finally:
+        release_db_connection(conn)
 
 def get_users_info():
     """Get detailed user information"""
     try:
         conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT user_id, username, email, first_name, last_name 
-            FROM users 
-            ORDER BY created_at
-        """)
-        users = cursor.fetchall()
-        cursor.close()
-        conn.close()
-        return users
     except Exception as e:
         print(f"Error getting users info: {e}")
         return []
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute("""
+                SELECT user_id, username, email, first_name, last_name 
+                FROM users 
+                ORDER BY created_at
+            """)
+            return cursor.fetchall()
+    except Exception as e:
+        print(f"Error getting users info: {e}")
+        return []
+    finally:
+        release_db_connection(conn)
 
 def add_test_user():
     """Add a test user"""
     try:
         conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            INSERT INTO users (username, email, password_hash, first_name, last_name)
-            VALUES (%s, %s, %s, %s, %s)
-            RETURNING user_id
-        """, (
-            'restore_test_data_user',
-            'restore_test_data@example.com',
-            '$2b$10$example_hash',
-            'RestoreData',
-            'Test'
-        ))
-        
-        user_id = cursor.fetchone()[0]
-        conn.commit()
-        cursor.close()
-        conn.close()
+    except Exception as e:
+        print(f"❌ Error adding test user: {e}")
+        return None
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute("""
+                INSERT INTO users (username, email, password_hash, first_name, last_name)
+                VALUES (%s, %s, %s, %s, %s)
+                RETURNING user_id
+            """, (
+                'restore_test_data_user',
+                'restore_test_data@example.com',
+                '$2b$10$example_hash',
+                'RestoreData',
+                'Test'
+            ))
+            user_id = cursor.fetchone()[0]
         
         print(f"✅ Added test user with ID: {user_id}")
         return user_id
@@ -80,6 +108,8 @@ def add_test_user():
     except Exception as e:
         print(f"❌ Error adding test user: {e}")
         return None
+    finally:
+        release_db_connection(conn)
 
 def test_restore_with_data_backup():
     """Test restore using a data backup file"""
@@ -121,10 +151,17 @@ def test_restore_with_data_backup():
     print(f"\n🔄 Testing restore from {backup_file}...")
     try:
         cmd = ['python', 'db/restore.py', backup_path, '--force']
+        close_db_connections()  # the pool reopens on the next query
         
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        # Print the restore log as it arrives instead of buffering it until the end
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                text=True, bufsize=1)
+        with proc.stdout:
+            for line in proc.stdout:
+                print(f"   {line}", end='')
+        returncode = proc.wait()
         
-        if result.returncode == 0:
+        if returncode == 0:
             print("✅ Restore command completed successfully")
             
             # Verify restore
@@ -157,8 +194,7 @@ def test_restore_with_data_backup():
                 return not test_user_exists
             
         else:
-            print("❌ Restore command failed")
-            print("STDERR:", result.stderr)
+            print(f"❌ Restore command failed (exit code {returncode})")
             return False
             
     except Exception as e: